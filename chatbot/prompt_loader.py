@@ -151,7 +151,7 @@ def get_react_reflection_prompt(variables: Dict[str, Any]) -> str:
     Get the reflection prompt for react reasoning.
     
     Args:
-        variables: Dictionary containing user_input and draft_response
+        variables: Dictionary containing system_prompt, context, user_input and draft_response
     
     Returns:
         Formatted reflection prompt content
@@ -164,7 +164,7 @@ def get_react_revision_prompt(variables: Dict[str, Any]) -> str:
     Get the revision prompt for react reasoning.
     
     Args:
-        variables: Dictionary containing system_prompt, user_input, draft_response, and reflection
+        variables: Dictionary containing system_prompt, context, user_input, draft_response, and reflection
     
     Returns:
         Formatted revision prompt content
@@ -0,0 +1,166 @@
+"""
+Test script for the reflection reasoning logic.
+Covers the revision verdict, the fast-path fallback, the step writer
+and progress step numbering.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to Python path to import utils module
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+import utils.react_reasoning as react_reasoning
+from utils.react_reasoning import STEP_NUMBERS, ReActReasoning, ReflectionStepWriter, Step
+
+
+def make_reasoner(llm=None, workflow=None) -> ReActReasoning:
+    """Build a reasoner without creating OpenAI clients or the cache."""
+    reasoner = object.__new__(ReActReasoning)
+    reasoner.model = "fake"
+    reasoner.llm = llm
+    reasoner.mode = "reflection"
+    reasoner.workflow = workflow
+    reasoner.cache = None
+    return reasoner
+
+
+def test_decision_verdict():
+    parse = make_reasoner()._parse_revision_decision
+    assert parse("A resposta está boa.\nDECISION: YES") is True
+    assert parse("Could be better, but it's fine.\nDECISION: NO") is False
+    # The last verdict wins when the model changes its mind
+    assert parse("DECISION: NO\nOn second thought, add an example.\nDECISION: YES") is True
+    assert parse("DECISION: YES\nActually it's complete.\nDECISION: NO") is False
+
+
+def test_decision_keyword_fallback():
+    """Without a verdict line, revision hints in the reflection decide."""
+    parse = make_reasoner()._parse_revision_decision
+    assert parse("The answer is missing a concrete example.") is True
+    assert parse("Seria bom melhorar a conclusão.") is True
+    assert parse("The answer is clear and complete.") is False
+
+
+class FakeTemplate:
+    def format_messages(self, **variables):
+        return [SimpleNamespace(content=str(variables))]
+
+
+class FakeLLM:
+    """JSON-mode LLM that always returns the same reply."""
+
+    def __init__(self, reply: str):
+        self.reply = reply
+
+    def bind(self, **kwargs):
+        return self
+
+    async def ainvoke(self, messages):
+        return SimpleNamespace(content=self.reply)
+
+
+class FakeWorkflow:
+    """Stands in for the compiled reflection graph."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, state, config=None):
+        self.calls += 1
+        state["final_response"] = "workflow answer"
+        state["iteration_count"] = 1
+        return state
+
+
+def test_malformed_fast_path_reply_falls_back_to_workflow():
+    original_template = react_reasoning._react_template
+    react_reasoning._react_template = lambda prompt_name: FakeTemplate()
+    try:
+        for reply in ("not json", '{"critique": "no draft key"}'):
+            workflow = FakeWorkflow()
+            reasoner = make_reasoner(FakeLLM(reply), workflow)
+            result = asyncio.run(reasoner.process_with_reasoning("Oi, tudo bem?", "system"))
+            assert workflow.calls == 1
+            assert result["final_answer"] == "workflow answer"
+            # The failed fast path records no steps of its own
+            assert result["reasoning_steps"] == []
+    finally:
+        react_reasoning._react_template = original_template
+
+
+class FakeQuery:
+    def __init__(self, client, steps):
+        self.client = client
+        self.steps = steps
+
+    def eq(self, column, value):
+        return self
+
+    async def execute(self):
+        await asyncio.sleep(0.05)
+        self.client.writes.append(self.steps)
+
+
+class FakeSupabase:
+    """Records every reflection_steps update written to conversations."""
+
+    def __init__(self):
+        self.writes = []
+
+    def table(self, name):
+        return SimpleNamespace(update=lambda values: FakeQuery(self, values["reflection_steps"]))
+
+
+def test_step_writer_coalesces_steps_and_flush_waits():
+    client = FakeSupabase()
+
+    async def run():
+        writer = ReflectionStepWriter(client, "conversation-1", debounce=0.05)
+        for number in range(1, 4):
+            writer.put(Step(step=number, type="generation", content=f"step {number}"))
+        await writer.flush()
+
+    asyncio.run(run())
+
+    # Three steps inside one debounce window become one write, and flush()
+    # returned only after that write finished
+    assert len(client.writes) == 1
+    assert [step["step"] for step in client.writes[0]] == [1, 2, 3]
+
+
+class FakeStreamingLLM:
+    """Streams a fixed reply in 50-character chunks."""
+
+    def __init__(self, reply: str):
+        self.reply = reply
+
+    async def astream(self, messages):
+        for start in range(0, len(self.reply), 50):
+            yield SimpleNamespace(content=self.reply[start:start + 50])
+
+
+def test_progress_step_has_its_own_number():
+    """One progress step, updated in place, numbered apart from its start and completion steps."""
+    reasoner = make_reasoner(FakeStreamingLLM("x" * 1000))
+    state = {"current_steps": [], "step_writer": None}
+    reply = asyncio.run(reasoner._stream_with_progress(state, [], "generation_progress"))
+
+    assert len(reply) == 1000
+    assert len(state["current_steps"]) == 1
+    progress = state["current_steps"][0]
+    assert progress.content == "1000 chars so far..."
+    assert STEP_NUMBERS["generation_start"] < progress.step < STEP_NUMBERS["generation"]
+    assert STEP_NUMBERS["revision_start"] < STEP_NUMBERS["revision_progress"] < STEP_NUMBERS["revision"]
+
+
+if __name__ == "__main__":
+    test_decision_verdict()
+    test_decision_keyword_fallback()
+    test_malformed_fast_path_reply_falls_back_to_workflow()
+    test_step_writer_coalesces_steps_and_flush_waits()
+    test_progress_step_has_its_own_number()
+    print("✅ Reflection reasoning tests passed")
@@ -0,0 +1,72 @@
+"""
+Test script for React Tavily's pure helpers.
+Checks URL normalization for source dedupe and the trivial-query gate.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path to import utils module
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from utils.reactTavily import NeedToKnow, ReactTavilyResearcher, url_key
+
+
+def test_url_key_normalizes_equivalent_urls():
+    """Scheme/host case, query parameter order and fragments don't change the key."""
+    base = url_key("https://example.com/report?a=1&b=2")
+    assert url_key("HTTPS://Example.COM/report?a=1&b=2") == base
+    assert url_key("https://example.com/report?b=2&a=1") == base
+    assert url_key("https://example.com/report?a=1&b=2#section-3") == base
+    assert url_key("  https://example.com/report?a=1&b=2  ") == base
+    assert url_key("https://example.com") == url_key("https://example.com/")
+
+
+def test_url_key_distinguishes_different_urls():
+    base = url_key("https://example.com/report?a=1")
+    # Paths are case-sensitive and query values matter
+    assert url_key("https://example.com/Report?a=1") != base
+    assert url_key("https://example.com/report?a=2") != base
+    assert url_key("https://example.org/report?a=1") != base
+
+
+def test_is_trivial_rejects_unresearchable_queries():
+    is_trivial = ReactTavilyResearcher._is_trivial
+    assert is_trivial("") == "empty query"
+    assert is_trivial("   ") == "empty query"
+    assert is_trivial("ai") == "query too short"
+    assert is_trivial("12345") == "query contains only digits"
+    assert is_trivial("Hello, thank you!") == "query contains no researchable content"
+    assert is_trivial("oi obrigada") == "query contains no researchable content"
+
+
+def test_is_trivial_accepts_real_queries():
+    is_trivial = ReactTavilyResearcher._is_trivial
+    assert is_trivial("Impact of AI on healthcare industry") == ""
+    assert is_trivial("hello world economy outlook") == ""
+
+
+def test_need_to_know_rejects_malformed_llm_fields():
+    """Bad decomposition fields raise ValueError, which triggers the fallback question."""
+    for fields in (
+        {"question": "Q", "priority": None},
+        {"question": None, "priority": 2},
+        {"question": "Q", "priority": 9},
+    ):
+        try:
+            NeedToKnow(**fields)
+        except ValueError:
+            continue
+        raise AssertionError(f"NeedToKnow accepted {fields}")
+
+    assert NeedToKnow(question="Q", priority="3").priority == 3
+
+
+if __name__ == "__main__":
+    test_url_key_normalizes_equivalent_urls()
+    test_url_key_distinguishes_different_urls()
+    test_is_trivial_rejects_unresearchable_queries()
+    test_is_trivial_accepts_real_queries()
+    test_need_to_know_rejects_malformed_llm_fields()
+    print("✅ React Tavily helper tests passed")
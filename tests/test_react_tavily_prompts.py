@@ -0,0 +1,44 @@
+"""
+Test script for the React Tavily report prompt.
+Checks that the cached report prompt builder matches the full template.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path to import utils module
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from utils.reactTavily import ReactTavilyResearcher
+
+
+def make_researcher() -> ReactTavilyResearcher:
+    """Create a researcher with prompts only (no LLM or API keys needed)."""
+    researcher = ReactTavilyResearcher.__new__(ReactTavilyResearcher)
+    researcher.verbose = False
+    researcher._create_prompts()
+    return researcher
+
+
+def test_report_messages_match_template():
+    """The cached system prefix + human tail equals report_prompt.format_messages."""
+    researcher = make_researcher()
+    kwargs = {
+        "query": "Latest {braces} in quantum computing",
+        "analysis": "Consolidated analysis citing [abc123].",
+        "sources": "[abc123]: Example - https://example.com",
+        "current_date": "Current Date: October 16, 2026 (UTC)",
+    }
+
+    expected = researcher.report_prompt.format_messages(**kwargs)
+
+    # Run twice so the second call goes through the cached system prefix
+    for _ in range(2):
+        actual = researcher._build_report_messages(**kwargs)
+        assert [(m.type, m.content) for m in actual] == [(m.type, m.content) for m in expected]
+
+
+if __name__ == "__main__":
+    test_report_messages_match_template()
+    print("✅ Report prompt messages match the template")
@@ -0,0 +1,94 @@
+"""
+Test script for React Tavily's async per-question research.
+Uses a fake Tavily search and a fake LLM to check the search timeout.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to Python path to import utils module
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from utils.reactTavily import NeedToKnow, ReactTavilyResearcher
+
+SEARCH_RESPONSE = {
+    "results": [
+        {"title": "Report A", "url": "https://example.com/a", "content": "Alpha"},
+        {"title": "Report B", "url": "https://example.com/b", "content": "Beta"},
+    ]
+}
+
+
+class FakeLLM:
+    """Answers every analysis call after a fixed delay."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def ainvoke(self, messages):
+        await asyncio.sleep(self.delay)
+        return SimpleNamespace(content="analysis")
+
+
+def make_researcher(search_delay: float, llm_delay: float, timeout: float = 0.05) -> ReactTavilyResearcher:
+    """Build a researcher without API clients, wired to the fakes."""
+    researcher = object.__new__(ReactTavilyResearcher)
+    researcher.verbose = False
+    researcher.per_question_timeout = timeout
+    researcher.llm = FakeLLM(llm_delay)
+    researcher._create_prompts()
+
+    async def fake_search(query, max_results, search_depth, include_answer):
+        await asyncio.sleep(search_delay)
+        return SEARCH_RESPONSE
+
+    researcher._tavily_search_async = fake_search
+    return researcher
+
+
+def research(researcher: ReactTavilyResearcher, question: NeedToKnow):
+    """Run one question and return the sources it registered."""
+    all_sources, sources_list, sources_formatted, url_index = {}, [], [], {}
+
+    async def run():
+        await researcher._aresearch_question(
+            1, 1, question, asyncio.Semaphore(1),
+            5, "advanced", "advanced",
+            all_sources, sources_list, sources_formatted, url_index
+        )
+
+    asyncio.run(run())
+    return all_sources, sources_list, sources_formatted
+
+
+def test_slow_analysis_is_not_timed_out():
+    """The timeout bounds only the search, so a slow LLM keeps its analysis and sources."""
+    question = NeedToKnow(question="What changed in the market?")
+    all_sources, sources_list, sources_formatted = research(
+        make_researcher(search_delay=0, llm_delay=0.2), question
+    )
+
+    assert question.analysis == "analysis"
+    assert len(question.search_results) == 2
+    assert len(all_sources) == len(sources_list) == len(sources_formatted) == 2
+
+
+def test_slow_search_times_out_without_registering_sources():
+    question = NeedToKnow(question="What changed in the market?")
+    all_sources, sources_list, sources_formatted = research(
+        make_researcher(search_delay=1, llm_delay=0), question
+    )
+
+    assert question.analysis == "(timed out)"
+    # Coverage and the registered sources agree: nothing from this question
+    assert question.search_results == []
+    assert not all_sources and not sources_list and not sources_formatted
+
+
+if __name__ == "__main__":
+    test_slow_analysis_is_not_timed_out()
+    test_slow_search_times_out_without_registering_sources()
+    print("✅ React Tavily async research tests passed")
@@ -0,0 +1,110 @@
+"""
+Test script for the reasoning response cache.
+Covers exact keys, scoped semantic lookups and semantic tier eviction.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path to import utils module
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from utils.response_cache import ReasoningCache
+
+
+class FakeEmbeddings:
+    """Embeds known texts to fixed vectors and counts embedding calls."""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.calls = 0
+
+    async def aembed_query(self, text):
+        self.calls += 1
+        return self.vectors[text]
+
+
+VECTORS = {
+    "what is churn?": [1.0, 0.0, 0.0],
+    "what's churn?": [0.99, 0.05, 0.0],
+    "pricing strategy": [0.0, 1.0, 0.0],
+}
+
+
+def make_cache(**kwargs) -> ReasoningCache:
+    return ReasoningCache(embeddings=FakeEmbeddings(VECTORS), **kwargs)
+
+
+def test_make_key_depends_on_every_input():
+    """Changing any prompt input changes the exact key; same inputs give the same key."""
+    key = ReasoningCache.make_key("sim", "system", "Usuário: oi")
+    assert key == ReasoningCache.make_key("sim", "system", "Usuário: oi")
+    assert key != ReasoningCache.make_key("sim", "system", "Usuário: tchau")
+    assert key != ReasoningCache.make_key("sim", "other system", "Usuário: oi")
+    assert key != ReasoningCache.make_key("não", "system", "Usuário: oi")
+    # The separator keeps field boundaries from colliding
+    assert ReasoningCache.make_key("ab", "c", "") != ReasoningCache.make_key("a", "bc", "")
+
+
+def test_exact_put_and_get():
+    cache = make_cache()
+    key = ReasoningCache.make_key("what is churn?", "system", "")
+    assert cache.get_exact(key) is None
+    cache.put(key, {"final_answer": "Churn is..."})
+    assert cache.get_exact(key) == {"final_answer": "Churn is..."}
+
+
+def test_semantic_skips_embedding_without_candidates():
+    """An empty scope returns immediately without calling the embeddings API."""
+    cache = make_cache()
+    result, embedding = asyncio.run(cache.get_semantic("what is churn?", "scope-a"))
+    assert result is None and embedding is None
+    assert cache.embeddings.calls == 0
+
+
+def test_semantic_matches_only_within_scope():
+    cache = make_cache()
+    answer = {"final_answer": "Churn is..."}
+    asyncio.run(cache.put_semantic("scope-a", "what is churn?", answer))
+
+    result, embedding = asyncio.run(cache.get_semantic("what's churn?", "scope-a"))
+    assert result == answer
+    assert embedding is not None
+
+    # Same question under a different history/system prompt never matches
+    result, _ = asyncio.run(cache.get_semantic("what's churn?", "scope-b"))
+    assert result is None
+
+    # Dissimilar question in the same scope doesn't match either
+    result, _ = asyncio.run(cache.get_semantic("pricing strategy", "scope-a"))
+    assert result is None
+
+
+def test_semantic_tier_evicts_oldest_entries():
+    cache = make_cache(max_semantic_entries=2)
+    asyncio.run(cache.put_semantic("scope-a", "what is churn?", {"n": 1}))
+    asyncio.run(cache.put_semantic("scope-b", "pricing strategy", {"n": 2}))
+    asyncio.run(cache.put_semantic("scope-c", "pricing strategy", {"n": 3}))
+
+    assert len(cache._results) == 2
+    assert cache._matrix.shape[0] == 2
+
+    # The evicted scope has no candidates left, so lookups don't embed
+    calls = cache.embeddings.calls
+    result, embedding = asyncio.run(cache.get_semantic("what is churn?", "scope-a"))
+    assert result is None and embedding is None
+    assert cache.embeddings.calls == calls
+
+    result, _ = asyncio.run(cache.get_semantic("pricing strategy", "scope-c"))
+    assert result == {"n": 3}
+
+
+if __name__ == "__main__":
+    test_make_key_depends_on_every_input()
+    test_exact_put_and_get()
+    test_semantic_skips_embedding_without_candidates()
+    test_semantic_matches_only_within_scope()
+    test_semantic_tier_evicts_oldest_entries()
+    print("✅ Reasoning cache tests passed")
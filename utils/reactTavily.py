@@ -9,15 +9,48 @@ from typing import Dict, Any, List, Optional, TypedDict
 from langgraph.graph import StateGraph, END
 from langchain_openai import ChatOpenAI
 from langchain_tavily import TavilySearch
-from langchain.schema import HumanMessage, SystemMessage, AIMessage
+from langchain.schema import HumanMessage, SystemMessage, AIMessage, BaseMessage
+from langchain_core.runnables import RunnableLambda
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
 from pydantic import BaseModel, Field
 import os
+import re
 import json
 import asyncio
-from datetime import datetime, timezone
+import aiohttp
+import queue
+import hashlib
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 from uuid import uuid4
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+# Queries made only of these tokens are not worth a full research run
+TRIVIAL_QUERY_TOKENS = frozenset({
+    "hi", "hello", "hey", "test", "testing", "ok", "okay", "thanks", "thank", "you",
+    "yes", "no", "asdf", "qwerty", "oi", "olá", "ola", "teste", "obrigado", "obrigada"
+})
+MIN_QUERY_LENGTH = 4
+
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+
+# Human turn of the report prompt; also formatted directly by _build_report_messages
+REPORT_HUMAN_TEMPLATE = "Query: {query}\n\nConsolidated Analysis:\n{analysis}\n\nAvailable Sources:\n{sources}\n\nGenerate the final report:"
+
+
+def url_key(url: str) -> bytes:
+    """Hash a URL after normalization (lowercase scheme/host, sorted query, no fragment)."""
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    normalized = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", query, ""))
+    return hashlib.blake2b(normalized.encode(), digest_size=8).digest()
+
 
 class SourceReference(BaseModel):
     """Individual source reference with metadata."""
@@ -40,15 +73,37 @@ class NeedToKnow(BaseModel):
     analysis: str = ""
 
 
+class FinalReport(BaseModel):
+    """Structured final report emitted directly by the LLM."""
+    summary: str = Field(..., description="Executive summary with temporal context when relevant")
+    key_findings: List[str] = Field(default_factory=list, description="Key findings, each with [source_id] citations")
+    detailed_analysis: str = Field(..., description="Detailed analysis with citations, recency indicators and limitations")
+    citations: Dict[str, str] = Field(default_factory=dict, description="Map of every [source_id] cited in the report to its source_id")
+    
+    def to_markdown(self) -> str:
+        """Render the structured report as a markdown document."""
+        findings = "\n".join(f"- {finding}" for finding in self.key_findings)
+        return (
+            f"## Executive Summary\n{self.summary}\n\n"
+            f"## Key Findings\n{findings}\n\n"
+            f"## Detailed Analysis\n{self.detailed_analysis}"
+        )
+
+
 class ResearchState(TypedDict):
     """Enhanced state for the research workflow."""
     original_query: str
     need_to_know_questions: List[NeedToKnow]
     all_sources: Dict[str, SourceReference]  # source_id -> SourceReference
+    sources_list: List[SourceReference]  # all_sources values, in insertion order
+    sources_formatted: List[str]  # "[source_id]: title - url" lines for the report prompt
+    url_index: Dict[bytes, str]  # url_key(url) -> source_id, dedupes sources across questions
     consolidated_analysis: str
     final_report: str
+    final_report_obj: Optional[FinalReport]
     error: Optional[str]
     metadata: Dict[str, Any]
+    progress_queue: Optional[Any]  # thread-safe queue.Queue of {"stage", "pct"} events, or None
 
 
 class ResearchRequest(BaseModel):
@@ -69,11 +124,17 @@ class ResearchResponse(BaseModel):
     key_findings: List[str]
     detailed_analysis: str
     sources: List[SourceReference]
-    need_to_know_coverage: List[Dict[str, str]]  # question -> summary
+    need_to_know_coverage: List[Dict[str, Any]]  # question, summary, sources_found
     citations_map: Dict[str, str]  # citation_id -> source_id
     raw_results: Optional[List[Dict[str, Any]]] = None
     timestamp: str
     metadata: Dict[str, Any]
+    
+    def model_dump_json(self, **kwargs) -> str:
+        """Serialize to JSON, using orjson when available and no options are given."""
+        if orjson is None or kwargs:
+            return super().model_dump_json(**kwargs)
+        return orjson.dumps(self.model_dump(), option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 class ReactTavilyResearcher:
@@ -88,7 +149,11 @@ class ReactTavilyResearcher:
     5. Returns comprehensive research reports with inline citations
     """
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4", verbose: bool = False):
+    # Matches inline [source_id] citations in generated reports
+    _citation_re = re.compile(r'\[([a-zA-Z0-9]+)\]')
+    
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4", verbose: bool = False,
+                 per_question_timeout: float = 20.0, max_concurrent_searches: int = 10):
         """
         Initialize the Enhanced React Tavily Researcher.
         
@@ -96,8 +161,14 @@ class ReactTavilyResearcher:
             api_key: Tavily API key (defaults to TAVILY_API_KEY env var)
             model: OpenAI model to use for analysis
             verbose: Enable detailed progress logging by default
+            per_question_timeout: Seconds allowed for each Need-to-Know question's
+                Tavily search (async path); the analysis call is not bounded by it
+            max_concurrent_searches: Most Tavily searches in flight at once (async path),
+                to stay under Tavily rate limits
         """
         self.verbose = verbose
+        self.per_question_timeout = per_question_timeout
+        self.max_concurrent_searches = max_concurrent_searches
         # Set up Tavily API key
         if api_key:
             os.environ["TAVILY_API_KEY"] = api_key
@@ -111,7 +182,16 @@ class ReactTavilyResearcher:
             openai_api_key=os.getenv("OPENAI_API_KEY")
         )
         
-        # Tavily search tool will be created dynamically per request
+        # Structured-output LLM for the final report (schema-validated JSON).
+        # function_calling works on every tool-capable model (incl. the gpt-4
+        # default) and accepts the free-form citations dict, unlike json_schema
+        self.structured_llm = self.llm.with_structured_output(FinalReport, method="function_calling")
+        
+        # Tavily search tool will be created dynamically per request (sync path);
+        # the async path posts to the Tavily API over one pooled aiohttp session,
+        # created lazily because it must be bound to the running event loop
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
         
         # Create prompts for different stages
         self._create_prompts()
@@ -119,13 +199,58 @@ class ReactTavilyResearcher:
         # Create the enhanced research workflow
         self.workflow = self._create_workflow()
     
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _date_context_cached(day_ordinal: int) -> str:
+        """Format the date context string for a given UTC day ordinal."""
+        return f"Current Date: {date.fromordinal(day_ordinal).strftime('%B %d, %Y')} (UTC)"
+    
     def _get_current_date_context(self) -> str:
         """Get current date context for temporal awareness."""
-        now = datetime.now(timezone.utc)
-        return f"Current Date: {now.strftime('%B %d, %Y')} (UTC)"
+        return self._date_context_cached(datetime.now(timezone.utc).toordinal())
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _is_trivial(query: str) -> str:
+        """Return why a query is too trivial to research, or an empty string."""
+        stripped = query.strip()
+        if not stripped:
+            return "empty query"
+        if len(stripped) < MIN_QUERY_LENGTH:
+            return "query too short"
+        if stripped.isdigit():
+            return "query contains only digits"
+        tokens = stripped.lower().split()
+        if all(token.strip("!?.,") in TRIVIAL_QUERY_TOKENS for token in tokens):
+            return "query contains no researchable content"
+        return ""
+    
+    def _empty_response(self, request: ResearchRequest, reason: str) -> ResearchResponse:
+        """Build an immediate response for queries that skip the workflow."""
+        return ResearchResponse.model_construct(
+            query=request.query,
+            summary=f"Research skipped: {reason}.",
+            key_findings=[],
+            detailed_analysis="",
+            sources=[],
+            need_to_know_coverage=[],
+            citations_map={},
+            timestamp=datetime.now().isoformat(),
+            metadata={
+                "sources_count": 0,
+                "questions_researched": 0,
+                "skipped": True,
+                "skip_reason": reason
+            }
+        )
     
     def _log_verbose(self, message: str, emoji: str = "🔧", force: bool = False):
-        """Log verbose messages if verbosity is enabled."""
+        """
+        Log verbose messages if verbosity is enabled.
+        
+        Callers guard f-strings that slice or scan large values with
+        `if self.verbose:` so nothing is formatted in non-verbose runs.
+        """
         if self.verbose or force:
             print(f"{emoji} {message}")
     
@@ -165,6 +290,12 @@ class ReactTavilyResearcher:
             print(f"   Results: {results_count} sources found")
             print()
     
+    def _report_progress(self, state: ResearchState, stage: str, pct: int):
+        """Push a progress event to the caller's queue, if one was given."""
+        progress_queue = state.get("progress_queue")
+        if progress_queue is not None:
+            progress_queue.put_nowait({"stage": stage, "pct": pct})
+    
     def _create_search_tool(self, max_results: int, search_depth: str, include_answer: str) -> TavilySearch:
         """Create a TavilySearch tool with specified parameters."""
         # Map include_answer string to boolean for TavilySearch
@@ -207,6 +338,235 @@ class ReactTavilyResearcher:
         
         return query
     
+    async def _get_http_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared aiohttp session, creating it on the running event loop.
+        
+        A session is bound to the loop that created it, so callers that start a
+        fresh loop per request (asyncio.run) get a new session and the previous
+        one is closed instead of leaking its connector.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http.closed or self._http_loop is not loop:
+            await self.aclose()
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+            )
+            self._http_loop = loop
+        return self._http
+    
+    async def aclose(self):
+        """Close the shared HTTP session."""
+        if self._http is not None and not self._http.closed:
+            try:
+                await self._http.close()
+            except RuntimeError as e:
+                # The session's event loop is already closed; its sockets went with it
+                self._log_verbose(f"Closing stale HTTP session failed: {e}")
+        self._http = None
+        self._http_loop = None
+    
+    async def _tavily_search_async(self, query: str, max_results: int, search_depth: str, include_answer: str) -> Dict[str, Any]:
+        """Call the Tavily search API directly over the shared HTTP session."""
+        session = await self._get_http_session()
+        payload = {
+            "query": query,
+            "max_results": max_results,
+            "search_depth": search_depth,
+            "include_answer": include_answer != "none"
+        }
+        headers = {"Authorization": f"Bearer {os.getenv('TAVILY_API_KEY')}"}
+        async with session.post(TAVILY_SEARCH_URL, json=payload, headers=headers) as resp:
+            resp.raise_for_status()
+            return await resp.json()
+    
+    def _start_question(self, i: int, total: int, question: NeedToKnow, search_depth: str, include_answer: str) -> str:
+        """Log the research area header and return the enhanced search query."""
+        if self.verbose:
+            self._log_verbose(f"\n--- Research Area {i}/{total} ---")
+            self._log_verbose(f"Question: {question.question}")
+            self._log_verbose(f"Priority: {question.priority}/5")
+            self._log_verbose(f"Context: {question.context}")
+        
+        # Enhance search query with temporal context if needed
+        self._log_thoughts(f"Analyzing query for temporal context...")
+        enhanced_query = self._enhance_search_query(question.question)
+        
+        self._log_verbose(f"Performing web search with Tavily (depth: {search_depth}, include_answer: {include_answer})...")
+        return enhanced_query
+    
+    async def _aresearch_question(
+        self,
+        i: int,
+        total: int,
+        question: NeedToKnow,
+        search_slots: asyncio.Semaphore,
+        max_results: int,
+        search_depth: str,
+        include_answer: str,
+        all_sources: Dict[str, SourceReference],
+        sources_list: List[SourceReference],
+        sources_formatted: List[str],
+        url_index: Dict[bytes, str]
+    ):
+        """
+        Search and analyze one Need-to-Know question on the async path.
+        
+        Only the Tavily search is bounded by per_question_timeout, so a slow
+        analysis never discards sources that were already registered.
+        """
+        try:
+            enhanced_query = self._start_question(i, total, question, search_depth, include_answer)
+            # One slow search can't stall the whole research; the clock starts
+            # once the question holds a search slot
+            async with search_slots:
+                search_results = await asyncio.wait_for(
+                    self._tavily_search_async(enhanced_query, max_results, search_depth, include_answer),
+                    timeout=self.per_question_timeout
+                )
+            messages = self._register_search_results(
+                i, question, enhanced_query, search_results,
+                all_sources, sources_list, sources_formatted, url_index
+            )
+            if messages:
+                question.analysis = (await self.llm.ainvoke(messages)).content
+                self._log_verbose(f"✅ Research completed for area {i}: {len(question.search_results)} sources analyzed")
+        
+        except asyncio.TimeoutError:
+            question.analysis = "(timed out)"
+            self._log_verbose(f"⏱️ Search timed out for area {i} after {self.per_question_timeout}s")
+        except Exception as e:
+            question.analysis = f"Research failed: {str(e)}"
+            self._log_verbose(f"❌ Research failed for area {i}: {str(e)}")
+    
+    def _add_source(
+        self,
+        title: str,
+        url: str,
+        content: str,
+        all_sources: Dict[str, SourceReference],
+        sources_list: List[SourceReference],
+        sources_formatted: List[str],
+        url_index: Dict[bytes, str]
+    ) -> SourceReference:
+        """Register a source, reusing the existing entry when its URL was already seen."""
+        key = url_key(url)
+        existing_id = url_index.get(key)
+        if existing_id is not None:
+            if self.verbose:
+                self._log_verbose(f"   ↺ Duplicate URL, reusing [{existing_id}]: {title[:60]}...")
+            return all_sources[existing_id]
+        
+        source_ref = SourceReference(
+            title=title,
+            url=url,
+            content=content,
+            snippet=content[:300] + "..." if len(content) > 300 else content
+        )
+        url_index[key] = source_ref.id
+        all_sources[source_ref.id] = source_ref
+        sources_list.append(source_ref)
+        sources_formatted.append(f"[{source_ref.id}]: {source_ref.title} - {source_ref.url}")
+        if self.verbose:
+            self._log_verbose(f"   ✓ Captured: {source_ref.title[:60]}...")
+        return source_ref
+    
+    def _register_search_results(
+        self,
+        i: int,
+        question: NeedToKnow,
+        enhanced_query: str,
+        search_results: Any,
+        all_sources: Dict[str, SourceReference],
+        sources_list: List[SourceReference],
+        sources_formatted: List[str],
+        url_index: Dict[bytes, str]
+    ) -> Optional[List[BaseMessage]]:
+        """
+        Store a question's search results as sources and build its analysis prompt.
+        
+        Returns:
+            Formatted analysis messages, or None when no valid sources were found
+        """
+        if not isinstance(search_results, list):
+            search_results = [search_results] if search_results else []
+        
+        # Log search results
+        self._log_search_details(question.question, enhanced_query, len(search_results))
+        
+        # Process and store results
+        self._log_thoughts("Processing and validating search results...")
+        if self.verbose:
+            self._log_verbose(f"Raw search results type: {type(search_results)}")
+        
+        processed_sources = []
+        
+        # Handle Tavily's response format
+        for result_item in search_results:
+            if isinstance(result_item, dict):
+                # Check if this is a Tavily response with nested results
+                if 'results' in result_item and isinstance(result_item['results'], list):
+                    if self.verbose:
+                        self._log_verbose(f"Found Tavily response with {len(result_item['results'])} nested results")
+                    # Process the nested results
+                    for nested_result in result_item['results']:
+                        if isinstance(nested_result, dict):
+                            title = nested_result.get('title', 'Unknown Source')
+                            url = nested_result.get('url', '')
+                            content = nested_result.get('content', '')
+                            
+                            if title and url:
+                                processed_sources.append(self._add_source(
+                                    title, url, content,
+                                    all_sources, sources_list, sources_formatted, url_index
+                                ))
+                else:
+                    # Handle direct result format
+                    title = result_item.get('title') or result_item.get('name') or 'Unknown Source'
+                    url = result_item.get('url') or result_item.get('link') or ''
+                    content = result_item.get('content') or result_item.get('snippet') or result_item.get('text') or ''
+                    
+                    if title and url:
+                        processed_sources.append(self._add_source(
+                            title, url, content,
+                            all_sources, sources_list, sources_formatted, url_index
+                        ))
+                    elif self.verbose:
+                        self._log_verbose(f"   ⚠️ Skipped result - missing title or URL: {result_item.keys()}")
+            elif self.verbose:
+                self._log_verbose(f"   ⚠️ Skipped non-dict result: {type(result_item)}")
+        
+        # A URL repeated within this question's results maps to the same source;
+        # list it once so the analysis prompt and source counts aren't inflated
+        processed_sources = list({source.id: source for source in processed_sources}.values())
+        question.search_results = processed_sources
+        
+        if not processed_sources:
+            question.analysis = "No reliable sources found for this question."
+            self._log_verbose(f"⚠️ No valid sources found for area {i}")
+            return None
+        
+        # Build the analysis prompt for this question
+        self._log_thoughts("Analyzing search results for key insights...")
+        formatted_results = []
+        for j, source in enumerate(processed_sources, 1):
+            formatted_results.append(f"""
+Source {j} [ID: {source.id}]:
+Title: {source.title}
+URL: {source.url}
+Content: {source.content[:500]}...
+""")
+        
+        results_text = "\n".join(formatted_results)
+        
+        # Generate analysis for this specific question with date context
+        self._log_verbose("Invoking LLM for research analysis...")
+        return self.research_analysis_prompt.format_messages(
+            question=question.question,
+            search_results=results_text,
+            current_date=self._get_current_date_context()
+        )
+    
     def _create_prompts(self):
         """Create specialized prompts for each workflow stage."""
         
@@ -310,8 +670,28 @@ Structure:
 - Key Findings (with citations and temporal relevance)
 - Detailed Analysis (with citations and recency indicators)
 - Limitations and Considerations (including temporal limitations)"""),
-            ("human", "Query: {query}\n\nConsolidated Analysis:\n{analysis}\n\nAvailable Sources:\n{sources}\n\nGenerate the final report:")
+            ("human", REPORT_HUMAN_TEMPLATE)
         ])
+        
+        # Formatted system prefix of the report prompt, rebuilt only when the date changes
+        self._report_system_msgs: List[BaseMessage] = []
+        self._report_system_date: Optional[str] = None
+    
+    def _build_report_messages(self, query: str, analysis: str, sources: str, current_date: str) -> List[BaseMessage]:
+        """
+        Build the report prompt messages, reusing the cached system prefix.
+        
+        Equivalent to self.report_prompt.format_messages(...), but only the
+        final human message is formatted per call.
+        """
+        if self._report_system_date != current_date:
+            self._report_system_msgs = self.report_prompt.format_messages(
+                query="", analysis="", sources="", current_date=current_date
+            )[:-1]
+            self._report_system_date = current_date
+        
+        human = HumanMessage(content=REPORT_HUMAN_TEMPLATE.format(query=query, analysis=analysis, sources=sources))
+        return [*self._report_system_msgs, human]
     
     def _create_workflow(self) -> StateGraph:
         """Create the enhanced LangGraph workflow with Need-to-Know decomposition."""
@@ -335,27 +715,29 @@ Structure:
                 )
                 
                 self._log_verbose("Invoking LLM for query decomposition...")
-                self._log_verbose(f"Formatted messages: {[m.content[:100] for m in messages]}")
+                if self.verbose:
+                    self._log_verbose(f"Formatted messages: {[m.content[:100] for m in messages]}")
                 response = self.llm.invoke(messages)
                 
                 # Parse JSON response
                 try:
                     self._log_verbose("Parsing LLM response for Need-to-Know questions...")
-                    self._log_verbose(f"Raw LLM response: {response.content[:200]}...")
+                    if self.verbose:
+                        self._log_verbose(f"Raw LLM response: {response.content[:200]}...")
                     
                     # Try to extract JSON from the response
                     content = response.content.strip()
                     
                     # Look for JSON array in the response
-                    import re
                     json_match = re.search(r'\[\s*\{.*?\}\s*\]', content, re.DOTALL)
                     if json_match:
                         json_str = json_match.group(0)
-                        self._log_verbose(f"Extracted JSON: {json_str[:100]}...")
+                        if self.verbose:
+                            self._log_verbose(f"Extracted JSON: {json_str[:100]}...")
                     else:
                         json_str = content
                     
-                    questions_data = json.loads(json_str)
+                    questions_data = orjson.loads(json_str) if orjson else json.loads(json_str)
                     need_to_know_questions = []
                     
                     if isinstance(questions_data, list):
@@ -394,13 +776,19 @@ Structure:
                 state["error"] = f"Query decomposition error: {str(e)}"
                 print(f"❌ Decomposition failed: {str(e)}")
             
+            self._report_progress(
+                state, f"🧠 Broke query into {len(state['need_to_know_questions'])} research questions", 15
+            )
             return state
         
         def research_individual_question(state: ResearchState) -> ResearchState:
-            """Research each Need-to-Know question in parallel (simulated)."""
+            """Research each Need-to-Know question sequentially (sync workflow path)."""
             try:
                 questions = state.get("need_to_know_questions", [])
                 all_sources = state.get("all_sources", {})
+                sources_list = state.get("sources_list", [])
+                sources_formatted = state.get("sources_formatted", [])
+                url_index = state.get("url_index", {})
                 metadata = state.get("metadata", {})
                 
                 # Get search configuration from request
@@ -408,7 +796,7 @@ Structure:
                 search_depth = metadata.get("search_depth", "advanced")
                 include_answer = metadata.get("include_answer", "advanced")
                 
-                self._log_action(f"🔍 Starting parallel research for {len(questions)} Need-to-Know areas", "starting")
+                self._log_action(f"🔍 Starting research for {len(questions)} Need-to-Know areas", "starting")
                 self._log_thoughts("Each question will be researched individually to ensure comprehensive coverage...")
                 
                 # Create search tool with current request configuration
@@ -416,113 +804,81 @@ Structure:
                 
                 for i, question in enumerate(questions, 1):
                     try:
-                        self._log_verbose(f"\n--- Research Area {i}/{len(questions)} ---")
-                        self._log_verbose(f"Question: {question.question}")
-                        self._log_verbose(f"Priority: {question.priority}/5")
-                        self._log_verbose(f"Context: {question.context}")
-                        
-                        # Enhance search query with temporal context if needed
-                        self._log_thoughts(f"Analyzing query for temporal context...")
-                        enhanced_query = self._enhance_search_query(question.question)
-                        
-                        self._log_verbose(f"Performing web search with Tavily (depth: {search_depth}, include_answer: {include_answer})...")
-                        # Perform search for this specific question
+                        enhanced_query = self._start_question(i, len(questions), question, search_depth, include_answer)
                         search_results = search_tool.invoke(enhanced_query)
-                        
-                        if not isinstance(search_results, list):
-                            search_results = [search_results] if search_results else []
-                        
-                        # Log search results
-                        self._log_search_details(question.question, enhanced_query, len(search_results))
-                        
-                        # Process and store results
-                        self._log_thoughts("Processing and validating search results...")
-                        self._log_verbose(f"Raw search results type: {type(search_results)}")
-                        
-                        processed_sources = []
-                        
-                        # Handle Tavily's response format
-                        for result_item in search_results:
-                            if isinstance(result_item, dict):
-                                # Check if this is a Tavily response with nested results
-                                if 'results' in result_item and isinstance(result_item['results'], list):
-                                    self._log_verbose(f"Found Tavily response with {len(result_item['results'])} nested results")
-                                    # Process the nested results
-                                    for nested_result in result_item['results']:
-                                        if isinstance(nested_result, dict):
-                                            title = nested_result.get('title', 'Unknown Source')
-                                            url = nested_result.get('url', '')
-                                            content = nested_result.get('content', '')
-                                            
-                                            if title and url:
-                                                source_ref = SourceReference(
-                                                    title=title,
-                                                    url=url,
-                                                    content=content,
-                                                    snippet=content[:300] + "..." if len(content) > 300 else content
-                                                )
-                                                processed_sources.append(source_ref)
-                                                all_sources[source_ref.id] = source_ref
-                                                self._log_verbose(f"   ✓ Captured: {source_ref.title[:60]}...")
-                                else:
-                                    # Handle direct result format
-                                    title = result_item.get('title') or result_item.get('name') or 'Unknown Source'
-                                    url = result_item.get('url') or result_item.get('link') or ''
-                                    content = result_item.get('content') or result_item.get('snippet') or result_item.get('text') or ''
-                                    
-                                    if title and url:
-                                        source_ref = SourceReference(
-                                            title=title,
-                                            url=url,
-                                            content=content,
-                                            snippet=content[:300] + "..." if len(content) > 300 else content
-                                        )
-                                        processed_sources.append(source_ref)
-                                        all_sources[source_ref.id] = source_ref
-                                        self._log_verbose(f"   ✓ Captured: {source_ref.title[:60]}...")
-                                    else:
-                                        self._log_verbose(f"   ⚠️ Skipped result - missing title or URL: {result_item.keys()}")
-                            else:
-                                self._log_verbose(f"   ⚠️ Skipped non-dict result: {type(result_item)}")
-                        
-                        question.search_results = processed_sources
-                        
-                        # Analyze results for this question
-                        if processed_sources:
-                            self._log_thoughts("Analyzing search results for key insights...")
-                            formatted_results = []
-                            for j, source in enumerate(processed_sources, 1):
-                                formatted_results.append(f"""
-Source {j} [ID: {source.id}]:
-Title: {source.title}
-URL: {source.url}
-Content: {source.content[:500]}...
-""")
-                            
-                            results_text = "\n".join(formatted_results)
-                            
-                            # Generate analysis for this specific question with date context
-                            self._log_verbose("Invoking LLM for research analysis...")
-                            current_date = self._get_current_date_context()
-                            messages = self.research_analysis_prompt.format_messages(
-                                question=question.question,
-                                search_results=results_text,
-                                current_date=current_date
-                            )
-                            
-                            analysis_response = self.llm.invoke(messages)
-                            question.analysis = analysis_response.content
-                            
-                            self._log_verbose(f"✅ Research completed for area {i}: {len(processed_sources)} sources analyzed")
-                        else:
-                            question.analysis = "No reliable sources found for this question."
-                            self._log_verbose(f"⚠️ No valid sources found for area {i}")
+                        messages = self._register_search_results(
+                            i, question, enhanced_query, search_results,
+                            all_sources, sources_list, sources_formatted, url_index
+                        )
+                        if messages:
+                            question.analysis = self.llm.invoke(messages).content
+                            self._log_verbose(f"✅ Research completed for area {i}: {len(question.search_results)} sources analyzed")
                     
                     except Exception as e:
                         question.analysis = f"Research failed: {str(e)}"
                         self._log_verbose(f"❌ Research failed for area {i}: {str(e)}")
+                    
+                    self._report_progress(
+                        state, f"🔍 Researched {i}/{len(questions)}: {question.question}", 15 + 50 * i // len(questions)
+                    )
                 
                 state["all_sources"] = all_sources
+                state["sources_list"] = sources_list
+                state["sources_formatted"] = sources_formatted
+                state["url_index"] = url_index
+                state["need_to_know_questions"] = questions
+                
+                self._log_action(f"Individual research completed - {len(all_sources)} total sources gathered across {len(questions)} research areas", "completed")
+                
+            except Exception as e:
+                state["error"] = f"Individual research error: {str(e)}"
+                print(f"❌ Individual research failed: {str(e)}")
+            
+            return state
+        
+        async def aresearch_individual_question(state: ResearchState) -> ResearchState:
+            """Research all Need-to-Know questions concurrently over a shared HTTP session."""
+            try:
+                questions = state.get("need_to_know_questions", [])
+                all_sources = state.get("all_sources", {})
+                sources_list = state.get("sources_list", [])
+                sources_formatted = state.get("sources_formatted", [])
+                url_index = state.get("url_index", {})
+                metadata = state.get("metadata", {})
+                
+                # Get search configuration from request
+                max_results = metadata.get("max_results", 5)
+                search_depth = metadata.get("search_depth", "advanced")
+                include_answer = metadata.get("include_answer", "advanced")
+                
+                self._log_action(f"🔍 Starting parallel research for {len(questions)} Need-to-Know areas", "starting")
+                self._log_thoughts("All questions are searched concurrently to minimize total latency...")
+                
+                completed = 0
+                # Cap in-flight searches so a wide decomposition can't trip Tavily rate limits
+                search_slots = asyncio.Semaphore(self.max_concurrent_searches)
+                
+                async def research_one(i: int, question: NeedToKnow):
+                    nonlocal completed
+                    await self._aresearch_question(
+                        i, len(questions), question, search_slots,
+                        max_results, search_depth, include_answer,
+                        all_sources, sources_list, sources_formatted, url_index
+                    )
+                    
+                    completed += 1
+                    self._report_progress(
+                        state, f"🔍 Researched {completed}/{len(questions)}: {question.question}", 15 + 50 * completed // len(questions)
+                    )
+                
+                async with asyncio.TaskGroup() as tg:
+                    for i, question in enumerate(questions, 1):
+                        tg.create_task(research_one(i, question))
+                
+                state["all_sources"] = all_sources
+                state["sources_list"] = sources_list
+                state["sources_formatted"] = sources_formatted
+                state["url_index"] = url_index
                 state["need_to_know_questions"] = questions
                 
                 self._log_action(f"Individual research completed - {len(all_sources)} total sources gathered across {len(questions)} research areas", "completed")
@@ -570,12 +926,14 @@ Sources Found: {len(q.search_results)}
                     current_date=current_date
                 )
                 
-                self._log_verbose(f"Consolidation inputs - Query: {query[:50]}..., Findings length: {len(findings_text)}")
-                self._log_verbose(f"Findings preview: {findings_text[:300]}...")
+                if self.verbose:
+                    self._log_verbose(f"Consolidation inputs - Query: {query[:50]}..., Findings length: {len(findings_text)}")
+                    self._log_verbose(f"Findings preview: {findings_text[:300]}...")
                 response = self.llm.invoke(messages)
                 state["consolidated_analysis"] = response.content
-                self._log_verbose(f"Consolidation output length: {len(response.content)}")
-                self._log_verbose(f"Consolidation preview: {response.content[:200]}...")
+                if self.verbose:
+                    self._log_verbose(f"Consolidation output length: {len(response.content)}")
+                    self._log_verbose(f"Consolidation preview: {response.content[:200]}...")
                 
                 self._log_action("Analysis consolidation completed - cross-cutting insights identified", "completed")
                 
@@ -584,6 +942,7 @@ Sources Found: {len(q.search_results)}
                 state["consolidated_analysis"] = "Failed to consolidate research findings."
                 print(f"❌ Consolidation failed: {str(e)}")
             
+            self._report_progress(state, "🔄 Consolidated findings", 85)
             return state
         
         def generate_final_report(state: ResearchState) -> ResearchState:
@@ -596,19 +955,15 @@ Sources Found: {len(q.search_results)}
                 self._log_action("📋 Generating final research report with citations", "starting")
                 self._log_thoughts("Creating comprehensive report with proper attribution and temporal context...")
                 
-                # Format sources for the prompt
-                sources_text = []
-                for source_id, source in all_sources.items():
-                    sources_text.append(f"[{source_id}]: {source.title} - {source.url}")
-                
-                sources_formatted = "\n".join(sources_text)
+                # Source lines are formatted as sources are gathered; just join them
+                sources_formatted = "\n".join(state.get("sources_formatted", []))
                 
                 self._log_verbose(f"Report will include {len(all_sources)} cited sources")
                 self._log_thoughts("Ensuring all factual claims include proper [source_id] citations...")
                 
                 # Generate final report with date context
                 current_date = self._get_current_date_context()
-                messages = self.report_prompt.format_messages(
+                messages = self._build_report_messages(
                     query=query,
                     analysis=analysis,
                     sources=sources_formatted,
@@ -616,11 +971,25 @@ Sources Found: {len(q.search_results)}
                 )
                 
                 self._log_verbose("Invoking LLM for final report generation...")
-                self._log_verbose(f"Report generation inputs - Query: {query[:50]}..., Analysis length: {len(analysis)}, Sources: {len(all_sources)}")
-                self._log_verbose(f"Analysis preview: {analysis[:200]}...")
-                self._log_verbose(f"Sources preview: {sources_formatted[:200]}...")
-                response = self.llm.invoke(messages)
-                state["final_report"] = response.content
+                if self.verbose:
+                    self._log_verbose(f"Report generation inputs - Query: {query[:50]}..., Analysis length: {len(analysis)}, Sources: {len(all_sources)}")
+                    self._log_verbose(f"Analysis preview: {analysis[:200]}...")
+                    self._log_verbose(f"Sources preview: {sources_formatted[:200]}...")
+                try:
+                    parsed = self.structured_llm.invoke(messages)
+                    state["final_report_obj"] = parsed
+                    state["final_report"] = parsed.to_markdown()
+                except Exception as e:
+                    # Fallback: free-text report, parsed later by the _extract_* helpers
+                    self._log_verbose(f"Structured report failed ({str(e)}), falling back to free text...")
+                    state["final_report_obj"] = None
+                    # Stream the free-text report so progress is visible before generation ends
+                    chunks = []
+                    for chunk in self.llm.stream(messages):
+                        chunks.append(chunk.content)
+                        if self.verbose and len(chunks) % 16 == 0:
+                            self._log_verbose(f"...{chunks[-1][:80]}", "✍️")
+                    state["final_report"] = "".join(chunks)
                 
                 self._log_action("Final research report generated with full citations and temporal context", "completed")
                 
@@ -629,6 +998,7 @@ Sources Found: {len(q.search_results)}
                 state["final_report"] = "Failed to generate final report."
                 print(f"❌ Report generation failed: {str(e)}")
             
+            self._report_progress(state, "📋 Generated final report", 95)
             return state
         
         # Create workflow graph
@@ -636,7 +1006,10 @@ Sources Found: {len(q.search_results)}
         
         # Add nodes for the enhanced workflow
         workflow.add_node("decompose_query", decompose_query)
-        workflow.add_node("research_questions", research_individual_question)
+        workflow.add_node(
+            "research_questions",
+            RunnableLambda(research_individual_question, afunc=aresearch_individual_question)
+        )
         workflow.add_node("consolidate_analysis", consolidate_analysis)
         workflow.add_node("generate_final_report", generate_final_report)
         
@@ -651,12 +1024,14 @@ Sources Found: {len(q.search_results)}
         
         return workflow.compile()
     
-    async def research(self, request: ResearchRequest) -> ResearchResponse:
+    async def research(self, request: ResearchRequest, progress_queue: Optional[queue.Queue] = None) -> ResearchResponse:
         """
         Perform enhanced research using the LangGraph workflow.
         
         Args:
             request: Research request with query and parameters
+            progress_queue: Optional thread-safe queue that receives
+                {"stage": str, "pct": int} events at each real milestone
             
         Returns:
             ResearchResponse with structured results and citations
@@ -666,14 +1041,26 @@ Sources Found: {len(q.search_results)}
             original_verbose = self.verbose
             self.verbose = request.verbose or self.verbose
             
+            # Bypass the LLM/search chain for queries that cannot yield useful research
+            trivial_reason = self._is_trivial(request.query)
+            if trivial_reason:
+                self.verbose = original_verbose
+                self._log_action(f"Skipping research: {trivial_reason}", "completed")
+                return self._empty_response(request, trivial_reason)
+            
             # Prepare initial state for enhanced workflow
             initial_state: ResearchState = {
                 "original_query": request.query,
                 "need_to_know_questions": [],
                 "all_sources": {},
+                "sources_list": [],
+                "sources_formatted": [],
+                "url_index": {},
                 "consolidated_analysis": "",
                 "final_report": "",
+                "final_report_obj": None,
                 "error": None,
+                "progress_queue": progress_queue,
                 "metadata": {
                     "max_results": request.max_results,
                     "topic": request.topic,
@@ -697,72 +1084,13 @@ Sources Found: {len(q.search_results)}
             # Execute enhanced workflow
             final_state = await self.workflow.ainvoke(initial_state)
             
-            # Extract and process results
-            final_report = final_state.get("final_report", "")
-            all_sources = final_state.get("all_sources", {})
-            need_to_know_questions = final_state.get("need_to_know_questions", [])
-            
-            # Process sources into list format
-            sources_list = list(all_sources.values())
-            
-            # Extract key findings from the final report
-            key_findings = self._extract_key_findings(final_report)
-            
-            # Create need-to-know coverage summary
-            need_to_know_coverage = []
-            for q in need_to_know_questions:
-                coverage = {
-                    "question": q.question,
-                    "summary": q.analysis[:200] + "..." if len(q.analysis) > 200 else q.analysis,
-                    "sources_found": str(len(q.search_results))  # Convert to string for validation
-                }
-                need_to_know_coverage.append(coverage)
-            
-            # Create citations map (extract [source_id] references from report)
-            citations_map = self._extract_citations_map(final_report, all_sources)
-            
-            # Create summary from final report
-            summary = self._extract_summary(final_report)
-            
-            response = ResearchResponse(
-                query=request.query,
-                summary=summary,
-                key_findings=key_findings,
-                detailed_analysis=final_state.get("consolidated_analysis", ""),
-                sources=sources_list,
-                need_to_know_coverage=need_to_know_coverage,
-                citations_map=citations_map,
-                raw_results=None,  # Could add raw search results if needed
-                timestamp=datetime.now().isoformat(),
-                metadata={
-                    "sources_count": len(sources_list),
-                    "questions_researched": len(need_to_know_questions),
-                    "research_date": self._get_current_date_context(),
-                    "error": final_state.get("error"),
-                    "search_params": {
-                        "max_results": request.max_results,
-                        "topic": request.topic,
-                        "search_depth": request.search_depth,
-                        "include_answer": request.include_answer
-                    }
-                }
-            )
-            
-            # Restore original verbosity
-            self.verbose = original_verbose
-            
-            if request.verbose:
-                print(f"\n🎉 RESEARCH COMPLETE!")
-                print(f"📊 Results: {len(sources_list)} sources across {len(need_to_know_questions)} research areas")
-                print("="*80 + "\n")
-            
-            return response
+            return self._build_response(request, final_state, original_verbose)
             
         except Exception as e:
             # Restore original verbosity on error
             self.verbose = original_verbose
             print(f"❌ Research failed: {str(e)}")
-            return ResearchResponse(
+            return ResearchResponse.model_construct(
                 query=request.query,
                 summary=f"Research failed: {str(e)}",
                 key_findings=[],
@@ -774,6 +1102,84 @@ Sources Found: {len(q.search_results)}
                 metadata={"error": str(e)}
             )
     
+    def _build_response(self, request: ResearchRequest, final_state: ResearchState, original_verbose: bool) -> ResearchResponse:
+        """
+        Build the ResearchResponse from the final workflow state.
+        
+        Shared by research() and research_sync(); restores the caller's
+        verbosity once the response has been assembled.
+        """
+        # Read each state field once
+        get = final_state.get
+        final_report_obj = get("final_report_obj")
+        need_to_know_questions = get("need_to_know_questions", [])
+        # Sources list is maintained alongside all_sources during research
+        sources_list = get("sources_list", [])
+        sources_count = len(sources_list)
+        questions_count = len(need_to_know_questions)
+        
+        # Summary, findings and citations come straight from the structured report
+        # when available; the regex extractors are the fallback for free-text reports
+        if final_report_obj:
+            summary = final_report_obj.summary
+            key_findings = final_report_obj.key_findings
+            # No regex pass over the report: keep only LLM citations that name a known source
+            all_sources = get("all_sources", {})
+            citations_map = {
+                cid: sid for cid, sid in final_report_obj.citations.items() if sid in all_sources
+            }
+            detailed_analysis = final_report_obj.detailed_analysis
+        else:
+            final_report = get("final_report", "")
+            summary = self._extract_summary(final_report)
+            key_findings = self._extract_key_findings(final_report)
+            citations_map = self._extract_citations_map(final_report, get("all_sources", {}))
+            detailed_analysis = get("consolidated_analysis", "")
+        
+        # Create need-to-know coverage summary
+        need_to_know_coverage = [
+            {
+                "question": q.question,
+                "summary": (a := q.analysis)[:200] + ("..." if len(a) > 200 else ""),
+                "sources_found": len(q.search_results)
+            }
+            for q in need_to_know_questions
+        ]
+        
+        response = ResearchResponse.model_construct(
+            query=request.query,
+            summary=summary,
+            key_findings=key_findings,
+            detailed_analysis=detailed_analysis,
+            sources=sources_list,
+            need_to_know_coverage=need_to_know_coverage,
+            citations_map=citations_map,
+            raw_results=None,  # Could add raw search results if needed
+            timestamp=datetime.now().isoformat(),
+            metadata={
+                "sources_count": sources_count,
+                "questions_researched": questions_count,
+                "research_date": self._get_current_date_context(),
+                "error": get("error"),
+                "search_params": {
+                    "max_results": request.max_results,
+                    "topic": request.topic,
+                    "search_depth": request.search_depth,
+                    "include_answer": request.include_answer
+                }
+            }
+        )
+        
+        # Restore original verbosity
+        self.verbose = original_verbose
+        
+        if request.verbose:
+            print(f"\n🎉 RESEARCH COMPLETE!")
+            print(f"📊 Results: {sources_count} sources across {questions_count} research areas")
+            print("="*80 + "\n")
+        
+        return response
+    
     def _extract_key_findings(self, report: str) -> List[str]:
         """Extract key findings from the final report."""
         try:
@@ -843,26 +1249,21 @@ Sources Found: {len(q.search_results)}
     def _extract_citations_map(self, report: str, all_sources: Dict[str, SourceReference]) -> Dict[str, str]:
         """Extract citation references from the report."""
         try:
-            citations_map = {}
-            # Find all [source_id] patterns in the report
-            import re
-            citation_pattern = r'\[([a-zA-Z0-9]+)\]'
-            matches = re.findall(citation_pattern, report)
-            
-            for match in matches:
-                if match in all_sources:
-                    citations_map[match] = match  # citation_id maps to source_id
-            
-            return citations_map
+            # Dedupe [source_id] patterns before matching against known sources
+            unique = {m.group(1) for m in self._citation_re.finditer(report)}
+            # citation_id maps to source_id
+            return {cid: cid for cid in unique & all_sources.keys()}
         except Exception:
             return {}
     
-    def research_sync(self, request: ResearchRequest) -> ResearchResponse:
+    def research_sync(self, request: ResearchRequest, progress_queue: Optional[queue.Queue] = None) -> ResearchResponse:
         """
         Synchronous version of enhanced research method.
         
         Args:
             request: Research request with query and parameters
+            progress_queue: Optional thread-safe queue that receives
+                {"stage": str, "pct": int} events at each real milestone
             
         Returns:
             ResearchResponse with structured results and citations
@@ -872,14 +1273,26 @@ Sources Found: {len(q.search_results)}
             original_verbose = self.verbose
             self.verbose = request.verbose or self.verbose
             
+            # Bypass the LLM/search chain for queries that cannot yield useful research
+            trivial_reason = self._is_trivial(request.query)
+            if trivial_reason:
+                self.verbose = original_verbose
+                self._log_action(f"Skipping research: {trivial_reason}", "completed")
+                return self._empty_response(request, trivial_reason)
+            
             # Prepare initial state for enhanced workflow
             initial_state: ResearchState = {
                 "original_query": request.query,
                 "need_to_know_questions": [],
                 "all_sources": {},
+                "sources_list": [],
+                "sources_formatted": [],
+                "url_index": {},
                 "consolidated_analysis": "",
                 "final_report": "",
+                "final_report_obj": None,
                 "error": None,
+                "progress_queue": progress_queue,
                 "metadata": {
                     "max_results": request.max_results,
                     "topic": request.topic,
@@ -898,65 +1311,13 @@ Sources Found: {len(q.search_results)}
             # Execute enhanced workflow synchronously
             final_state = self.workflow.invoke(initial_state)
             
-            # Extract and process results (same as async version)
-            final_report = final_state.get("final_report", "")
-            all_sources = final_state.get("all_sources", {})
-            need_to_know_questions = final_state.get("need_to_know_questions", [])
-            
-            sources_list = list(all_sources.values())
-            key_findings = self._extract_key_findings(final_report)
-            
-            need_to_know_coverage = []
-            for q in need_to_know_questions:
-                coverage = {
-                    "question": q.question,
-                    "summary": q.analysis[:200] + "..." if len(q.analysis) > 200 else q.analysis,
-                    "sources_found": str(len(q.search_results))  # Convert to string for validation
-                }
-                need_to_know_coverage.append(coverage)
-            
-            citations_map = self._extract_citations_map(final_report, all_sources)
-            summary = self._extract_summary(final_report)
-            
-            response = ResearchResponse(
-                query=request.query,
-                summary=summary,
-                key_findings=key_findings,
-                detailed_analysis=final_state.get("consolidated_analysis", ""),
-                sources=sources_list,
-                need_to_know_coverage=need_to_know_coverage,
-                citations_map=citations_map,
-                raw_results=None,
-                timestamp=datetime.now().isoformat(),
-                metadata={
-                    "sources_count": len(sources_list),
-                    "questions_researched": len(need_to_know_questions),
-                    "research_date": self._get_current_date_context(),
-                    "error": final_state.get("error"),
-                    "search_params": {
-                        "max_results": request.max_results,
-                        "topic": request.topic,
-                        "search_depth": request.search_depth,
-                        "include_answer": request.include_answer
-                    }
-                }
-            )
-            
-            # Restore original verbosity
-            self.verbose = original_verbose
-            
-            if request.verbose:
-                print(f"\n🎉 RESEARCH COMPLETE!")
-                print(f"📊 Results: {len(sources_list)} sources across {len(need_to_know_questions)} research areas")
-                print("="*80 + "\n")
-            
-            return response
+            return self._build_response(request, final_state, original_verbose)
             
         except Exception as e:
             # Restore original verbosity on error
             self.verbose = original_verbose
             print(f"❌ Research failed: {str(e)}")
-            return ResearchResponse(
+            return ResearchResponse.model_construct(
                 query=request.query,
                 summary=f"Research failed: {str(e)}",
                 key_findings=[],
@@ -971,32 +1332,25 @@ Sources Found: {len(q.search_results)}
 
 # React-style hooks and utilities
 class UseResearch:
-    """Enhanced React-style hook for research functionality."""
+    """
+    Enhanced React-style hook for research functionality.
+    
+    The hook keeps no per-call loading/error/data state, so a single instance
+    can serve concurrent research calls. Callers track the returned awaitable
+    themselves; progress is reported through the researcher's _log_* output.
+    """
     
     def __init__(self, researcher: ReactTavilyResearcher):
         self.researcher = researcher
-        self.loading = False
-        self.error = None
-        self.data = None
     
     async def research(self, query: str, **kwargs) -> ResearchResponse:
-        """Perform enhanced research with loading state management."""
-        self.loading = True
-        self.error = None
-        
-        try:
-            request = ResearchRequest(query=query, **kwargs)
-            self.data = await self.researcher.research(request)
-            return self.data
-        except Exception as e:
-            self.error = str(e)
-            raise
-        finally:
-            self.loading = False
+        """Perform enhanced research for a query."""
+        return await self.researcher.research(ResearchRequest(query=query, **kwargs))
 
 
 # Factory function for easy instantiation
-def create_researcher(api_key: Optional[str] = None, model: str = "gpt-4", verbose: bool = False) -> ReactTavilyResearcher:
+def create_researcher(api_key: Optional[str] = None, model: str = "gpt-4", verbose: bool = False,
+                      per_question_timeout: float = 20.0, max_concurrent_searches: int = 10) -> ReactTavilyResearcher:
     """
     Factory function to create a ReactTavilyResearcher instance.
     
@@ -1004,11 +1358,19 @@ def create_researcher(api_key: Optional[str] = None, model: str = "gpt-4", verbo
         api_key: Tavily API key (optional if set in environment)
         model: OpenAI model to use
         verbose: Enable verbose logging by default
+        per_question_timeout: Seconds allowed for each Need-to-Know question's search
+        max_concurrent_searches: Most Tavily searches in flight at once
         
     Returns:
         Configured ReactTavilyResearcher instance
     """
-    return ReactTavilyResearcher(api_key=api_key, model=model, verbose=verbose)
+    return ReactTavilyResearcher(
+        api_key=api_key,
+        model=model,
+        verbose=verbose,
+        per_question_timeout=per_question_timeout,
+        max_concurrent_searches=max_concurrent_searches
+    )
 
 
 # Enhanced example usage
@@ -1030,7 +1392,10 @@ if __name__ == "__main__":
         )
         
         # Perform enhanced research
-        result = await researcher.research(request)
+        try:
+            result = await researcher.research(request)
+        finally:
+            await researcher.aclose()
         
         # Print enhanced results
         print("\n" + "="*60)
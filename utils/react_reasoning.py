@@ -11,18 +11,85 @@ Future enhancement: Tool integration can be added to the generate/revise steps
 for external data retrieval, calculations, or other tool-based operations.
 """
 
-from typing import Dict, Any, List, TypedDict, Optional
-from langchain_openai import ChatOpenAI
-from langchain.schema import HumanMessage, SystemMessage, AIMessage
-from langgraph.graph import StateGraph, END
-from datetime import datetime
+from typing import Dict, Any, List, TypedDict, Optional, TYPE_CHECKING
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+import asyncio
+import inspect
+import json
 import os
+import re
 import sys
+import time
 from pathlib import Path
 
 # Add the parent directory to the path to import from chatbot module
 sys.path.append(str(Path(__file__).parent.parent))
-from chatbot.prompt_loader import get_react_generate_prompt, get_react_reflection_prompt, get_react_revision_prompt
+
+# LangChain, LangGraph and the OpenAI SDK are imported on first use, so
+# importing this module (e.g. just for ReflectionState) stays cheap
+if TYPE_CHECKING:
+    from langchain.prompts import ChatPromptTemplate
+    from langchain.schema import SystemMessage
+    from langchain_openai import ChatOpenAI
+    from langgraph.graph import StateGraph
+    from utils.response_cache import ReasoningCache
+
+
+@lru_cache(maxsize=None)
+def _react_template(prompt_name: str) -> "ChatPromptTemplate":
+    """
+    Load a react_reasoning prompt file as a system-message template.
+    
+    Each file is read and parsed once, on first use, not on every request.
+    """
+    from langchain.prompts import ChatPromptTemplate
+    from chatbot.prompt_loader import load_prompt_template
+    
+    return ChatPromptTemplate.from_messages([
+        ("system", load_prompt_template(prompt_name, "react_reasoning").template)
+    ])
+
+# Explicit revision verdict the reflection prompt asks the model to end with
+DECISION_RE = re.compile(r"DECISION:\s*(YES|NO)")
+
+# Keywords that suggest a revision when the verdict line is missing; word
+# prefixes so "improvement"/"melhorar"/"adicionar" still match
+_REVISE_HINT = re.compile(r"\b(improv|better|missing|add|melhor|adicion)", re.IGNORECASE)
+
+# Queries at or below these sizes use the single-call fast path
+FAST_PATH_MAX_INPUT_CHARS = 500
+FAST_PATH_MAX_HISTORY = 4
+
+# Drafts shorter than this (acknowledgments, "I don't know") skip reflection
+MIN_REFLECT_DRAFT_CHARS = 120
+
+# Draft temperatures for best-of-N mode, one parallel candidate each
+BEST_OF_N_TEMPERATURES = (0.3, 0.9)
+
+# Step number for each step type, unique within one reply. Progress steps
+# sit between their start and completion steps; revision_start and
+# finalization share 6 because a reply only ever has one of them
+STEP_NUMBERS = {
+    "generation_start": 1,
+    "generation_progress": 2,
+    "generation": 3,
+    "reflection_start": 4,
+    "reflection": 5,
+    "revision_start": 6,
+    "finalization": 6,
+    "revision_progress": 7,
+    "revision": 8,
+}
+
+@dataclass(slots=True)
+class Step:
+    """One reflection step as recorded in current_steps."""
+    step: int
+    type: str
+    content: str
+    timestamp_ns: int = field(default_factory=time.time_ns)
 
 class ReflectionState(TypedDict):
     """State for reflection workflow"""
@@ -37,19 +104,125 @@ class ReflectionState(TypedDict):
     # For real-time updates
     supabase_client: Any
     conversation_id: str
-    current_steps: List[Dict[str, Any]]
+    current_steps: List[Step]
+    step_writer: Any  # ReflectionStepWriter persisting current_steps, or None
+
+def _append_step(steps: List[Step], step: Step):
+    """Append a step unless it is the last entry already (an in-place update)."""
+    if not steps or steps[-1] is not step:
+        steps.append(step)
+
+def _serialize_steps(steps: List[Step]) -> List[Dict[str, Any]]:
+    """Turn steps into the JSON dicts stored in the DB, with ISO timestamps."""
+    return [
+        {
+            "step": step.step,
+            "type": step.type,
+            "content": step.content,
+            "timestamp": datetime.fromtimestamp(step.timestamp_ns / 1e9, tz=timezone.utc).isoformat()
+        }
+        for step in steps
+    ]
+
+class ReflectionStepWriter:
+    """
+    Coalesces reflection step updates into debounced conversation writes.
+    
+    Steps are queued without blocking; one background task collects every
+    step that arrives within the debounce window and writes the full list
+    in a single update. Works with both the sync and async Supabase clients;
+    sync writes run in a worker thread (asyncio.to_thread).
+    """
+    
+    def __init__(self, supabase_client, conversation_id: str, debounce: float = 0.2):
+        self.supabase_client = supabase_client
+        self.conversation_id = conversation_id
+        self.debounce = debounce
+        self._steps: List[Step] = []
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._writer = asyncio.create_task(self._drain_steps())
+    
+    def put(self, step: Step):
+        """Queue a step for the next write."""
+        self._queue.put_nowait(step)
+    
+    async def flush(self):
+        """Wait until every queued step has been written, then stop the writer."""
+        await self._queue.join()
+        self._writer.cancel()
+    
+    async def _drain_steps(self):
+        while True:
+            _append_step(self._steps, await self._queue.get())
+            await asyncio.sleep(self.debounce)
+            
+            # Collapse everything that arrived during the debounce window
+            drained = 1
+            while not self._queue.empty():
+                _append_step(self._steps, self._queue.get_nowait())
+                drained += 1
+            
+            await self._write(_serialize_steps(self._steps))
+            for _ in range(drained):
+                self._queue.task_done()
+    
+    async def _write(self, steps: List[Dict[str, Any]]):
+        try:
+            # Update the conversation record with current reflection steps
+            query = self.supabase_client.table("conversations").update({
+                "reflection_steps": steps
+            }).eq("id", self.conversation_id)
+            if inspect.iscoroutinefunction(query.execute):
+                await query.execute()
+            else:
+                # Sync client: run the HTTP round-trip on a worker thread so
+                # the event loop keeps streaming LLM tokens meanwhile
+                await asyncio.to_thread(query.execute)
+            
+            print(f"🔍 Updated DB with {len(steps)} steps (latest: {steps[-1]['type']})")
+        except Exception as e:
+            print(f"Error updating reflection steps in DB: {e}")
+
+@lru_cache(maxsize=4)
+def _get_llm(model: str, temperature: float) -> "ChatOpenAI":
+    """Shared ChatOpenAI client per (model, temperature), reusing its pooled connections."""
+    from langchain_openai import ChatOpenAI
+    
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        openai_api_key=os.getenv("OPENAI_API_KEY")
+    )
+
+@lru_cache(maxsize=1)
+def _get_cache() -> "ReasoningCache":
+    """Process-wide reasoning cache, created on first use."""
+    from utils.response_cache import ReasoningCache
+    
+    return ReasoningCache()
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected mid-run
+_background_tasks: set = set()
+
+def _run_in_background(coro):
+    """Schedule a coroutine without awaiting it."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
 class ReActReasoning:
     """Reflection-based reasoning system - a thinking machine for complex queries."""
     
-    def __init__(self):
-        self.llm = ChatOpenAI(
-            model=os.getenv("DEFAULT_LLM", "gpt-4o-mini"),
-            temperature=0.7,
-            openai_api_key=os.getenv("OPENAI_API_KEY")
-        )
+    def __init__(self, use_cache: bool = True, mode: Optional[str] = None):
+        self.model = os.getenv("DEFAULT_LLM", "gpt-4o-mini")
+        self.llm = _get_llm(self.model, 0.7)
+        # "best_of_n" (parallel drafts + pick) or "reflection" (generate/reflect/revise graph)
+        self.mode = mode or os.getenv("REASONING_MODE", "reflection")
         self.max_iterations = 2  # Generate -> Reflect -> Revise (if needed)
         self.workflow = self._create_reflection_workflow()
+        # Exact + semantic response cache in front of the workflow, shared
+        # process-wide since callers build a new reasoner per request
+        self.cache = _get_cache() if use_cache else None
     
     async def process_with_reasoning(
         self, 
@@ -61,10 +234,35 @@ class ReActReasoning:
     ) -> Dict[str, Any]:
         """Process complex query using reflection workflow."""
         
+        # Only the last two messages ever reach a prompt, so the state never
+        # carries more than that through the graph
+        history = list(conversation_history or [])
+        history_length = len(history)
+        history = history[-2:]
+        
+        cache_key = None
+        cache_scope = None
+        embedding = None
+        if self.cache:
+            formatted_history = self._format_history(history)
+            cache_key = self.cache.make_key(user_input, system_prompt, formatted_history)
+            # Semantic matches must share the system prompt and history, so a
+            # repeated "sim" in a different conversation context never matches
+            cache_scope = self.cache.make_scope(system_prompt, formatted_history)
+            cached = self.cache.get_exact(cache_key)
+            if cached is None:
+                try:
+                    cached, embedding = await self.cache.get_semantic(user_input, cache_scope)
+                except Exception as e:
+                    print(f"Semantic cache lookup failed: {e}")
+            if cached is not None:
+                print("⚡ Reasoning cache hit")
+                return cached
+        
         initial_state = ReflectionState(
             user_input=user_input,
             system_prompt=system_prompt,
-            conversation_history=conversation_history or [],
+            conversation_history=history,
             draft_response="",
             reflection="",
             final_response="",
@@ -72,136 +270,168 @@ class ReActReasoning:
             iteration_count=0,
             supabase_client=supabase_client,
             conversation_id=conversation_id or "",
-            current_steps=[]
+            current_steps=[],
+            step_writer=(
+                ReflectionStepWriter(supabase_client, conversation_id)
+                if supabase_client and conversation_id else None
+            )
         )
         
-        # Run the reflection workflow
-        result = await self.workflow.ainvoke(initial_state)
+        try:
+            # Short queries: draft, critique and revise in one LLM call;
+            # everything else (or a malformed fast-path reply) runs best-of-N
+            # or, failing that, the full reflection workflow
+            result = None
+            if len(user_input) < FAST_PATH_MAX_INPUT_CHARS and history_length <= FAST_PATH_MAX_HISTORY:
+                result = await self._run_fast_path(initial_state)
+            if result is None and self.mode == "best_of_n":
+                result = await self._run_best_of_n(initial_state)
+            if result is None:
+                result = await self.workflow.ainvoke(
+                    initial_state,
+                    config={"configurable": {"reasoner": self}}
+                )
+        finally:
+            # Make sure every step update has landed before the caller writes the final answer
+            if initial_state["step_writer"]:
+                await initial_state["step_writer"].flush()
         
-        return {
-            "reasoning_steps": self._format_reflection_steps(result),
+        response = {
+            # The same steps the UI was shown while reasoning
+            "reasoning_steps": _serialize_steps(result["current_steps"]),
             "final_answer": result["final_response"],
             "step_count": result["iteration_count"],
             "reasoning_used": True
         }
+        
+        if self.cache:
+            self.cache.put(cache_key, response)
+            # Embedding a new input for the semantic tier happens after the answer is returned
+            _run_in_background(self.cache.put_semantic(cache_scope, user_input, response, embedding))
+        
+        return response
     
-    def _create_reflection_workflow(self) -> StateGraph:
-        """Create LangGraph workflow for reflection pattern."""
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _create_reflection_workflow() -> "StateGraph":
+        """
+        Create LangGraph workflow for reflection pattern.
+        
+        The compiled graph is built once and shared by every instance; nodes
+        get the calling ReActReasoning from config["configurable"]["reasoner"].
+        """
+        from langchain_core.runnables import RunnableConfig
+        from langgraph.graph import StateGraph, END
         
-        def generate_response(state: ReflectionState) -> ReflectionState:
+        async def generate_response(state: ReflectionState, config: RunnableConfig) -> ReflectionState:
             """Generate initial response to the query"""
             print("💭 Reflection Step 1: GENERATING")
+            reasoner: ReActReasoning = config["configurable"]["reasoner"]
             
             # Add initial step to show we started thinking
-            initial_step = {
-                "step": 1,
-                "type": "generation_start",
-                "content": "Starting to generate response...",
-                "timestamp": datetime.now().isoformat()
-            }
-            self._update_reflection_steps_in_db(state, initial_step)
+            initial_step = Step(
+                step=STEP_NUMBERS["generation_start"],
+                type="generation_start",
+                content="Starting to generate response..."
+            )
+            reasoner._update_reflection_steps_in_db(state, initial_step)
             
-            generate_prompt = self._create_generate_prompt(state)
-            response = self.llm.invoke([generate_prompt])
+            generate_prompt = reasoner._create_generate_prompt(state)
+            draft = await reasoner._stream_with_progress(state, [generate_prompt], "generation_progress")
             
-            state["draft_response"] = response.content
+            state["draft_response"] = draft
             state["iteration_count"] += 1
             
             # Update with generation complete
-            generation_step = {
-                "step": 2,
-                "type": "generation",
-                "content": f"Initial response generated ({len(response.content)} chars)",
-                "timestamp": datetime.now().isoformat()
-            }
-            self._update_reflection_steps_in_db(state, generation_step)
+            generation_step = Step(
+                step=STEP_NUMBERS["generation"],
+                type="generation",
+                content=f"Initial response generated ({len(draft)} chars)"
+            )
+            reasoner._update_reflection_steps_in_db(state, generation_step)
             
             return state
         
-        def reflect_on_response(state: ReflectionState) -> ReflectionState:
+        async def reflect_on_response(state: ReflectionState, config: RunnableConfig) -> ReflectionState:
             """Reflect on the draft response and identify improvements"""
             print("🤔 Reflection Step 2: REFLECTING")
+            reasoner: ReActReasoning = config["configurable"]["reasoner"]
             
             # Add reflection start step
-            reflection_start_step = {
-                "step": 3,
-                "type": "reflection_start",
-                "content": "Analyzing response quality...",
-                "timestamp": datetime.now().isoformat()
-            }
-            self._update_reflection_steps_in_db(state, reflection_start_step)
+            reflection_start_step = Step(
+                step=STEP_NUMBERS["reflection_start"],
+                type="reflection_start",
+                content="Analyzing response quality..."
+            )
+            reasoner._update_reflection_steps_in_db(state, reflection_start_step)
             
-            reflect_prompt = self._create_reflection_prompt(state)
-            response = self.llm.invoke([reflect_prompt])
+            reflect_prompt = reasoner._create_reflection_prompt(state)
+            response = await reasoner.llm.ainvoke([reflect_prompt])
             
             state["reflection"] = response.content
             
-            # Simple heuristic: if reflection suggests improvements, revise
-            state["needs_revision"] = (
-                "improve" in response.content.lower() or 
-                "better" in response.content.lower() or
-                "missing" in response.content.lower() or
-                "add" in response.content.lower()
-            )
+            state["needs_revision"] = reasoner._parse_revision_decision(response.content)
             
             # Add reflection complete step
-            reflection_step = {
-                "step": 4,
-                "type": "reflection",
-                "content": response.content[:200] + "..." if len(response.content) > 200 else response.content,
-                "timestamp": datetime.now().isoformat()
-            }
-            self._update_reflection_steps_in_db(state, reflection_step)
+            reflection_step = Step(
+                step=STEP_NUMBERS["reflection"],
+                type="reflection",
+                content=response.content[:200] + "..." if len(response.content) > 200 else response.content
+            )
+            reasoner._update_reflection_steps_in_db(state, reflection_step)
             
             return state
         
-        def revise_response(state: ReflectionState) -> ReflectionState:
+        async def revise_response(state: ReflectionState, config: RunnableConfig) -> ReflectionState:
             """Revise the response based on reflection"""
             print("✨ Reflection Step 3: REVISING")
+            reasoner: ReActReasoning = config["configurable"]["reasoner"]
             
             # Add revision start step
-            revision_start_step = {
-                "step": 5,
-                "type": "revision_start",
-                "content": "Improving response based on reflection...",
-                "timestamp": datetime.now().isoformat()
-            }
-            self._update_reflection_steps_in_db(state, revision_start_step)
+            revision_start_step = Step(
+                step=STEP_NUMBERS["revision_start"],
+                type="revision_start",
+                content="Improving response based on reflection..."
+            )
+            reasoner._update_reflection_steps_in_db(state, revision_start_step)
             
-            revise_prompt = self._create_revision_prompt(state)
-            response = self.llm.invoke([revise_prompt])
+            revise_prompt = reasoner._create_revision_prompt(state)
+            revised = await reasoner._stream_with_progress(state, [revise_prompt], "revision_progress")
             
-            state["final_response"] = response.content
+            state["final_response"] = revised
             state["iteration_count"] += 1
             
             # Add revision complete step
-            revision_step = {
-                "step": 6,
-                "type": "revision",
-                "content": f"Response revised ({len(response.content)} chars)",
-                "timestamp": datetime.now().isoformat()
-            }
-            self._update_reflection_steps_in_db(state, revision_step)
+            revision_step = Step(
+                step=STEP_NUMBERS["revision"],
+                type="revision",
+                content=f"Response revised ({len(revised)} chars)"
+            )
+            reasoner._update_reflection_steps_in_db(state, revision_step)
             
             return state
         
-        def finalize_response(state: ReflectionState) -> ReflectionState:
+        async def finalize_response(state: ReflectionState, config: RunnableConfig) -> ReflectionState:
             """Use draft as final if no revision needed"""
             print("✅ Reflection: FINALIZING")
+            reasoner: ReActReasoning = config["configurable"]["reasoner"]
             
             state["final_response"] = state["draft_response"]
             
             # Add finalization step
-            finalization_step = {
-                "step": 5,
-                "type": "finalization",
-                "content": "Response approved without revision",
-                "timestamp": datetime.now().isoformat()
-            }
-            self._update_reflection_steps_in_db(state, finalization_step)
+            finalization_step = Step(
+                step=STEP_NUMBERS["finalization"],
+                type="finalization",
+                content="Response approved without revision"
+            )
+            reasoner._update_reflection_steps_in_db(state, finalization_step)
             
             return state
         
+        def should_reflect(state: ReflectionState) -> str:
+            """Skip reflection for drafts too short to be worth revising"""
+            return "reflect" if len(state["draft_response"]) >= MIN_REFLECT_DRAFT_CHARS else "finalize"
+        
         def should_revise(state: ReflectionState) -> str:
             """Determine if revision is needed"""
             return "revise" if state["needs_revision"] else "finalize"
@@ -216,7 +446,14 @@ class ReActReasoning:
         workflow.add_node("finalize", finalize_response)
         
         # Add edges
-        workflow.add_edge("generate", "reflect")
+        workflow.add_conditional_edges(
+            "generate",
+            should_reflect,
+            {
+                "reflect": "reflect",
+                "finalize": "finalize"
+            }
+        )
         workflow.add_conditional_edges(
             "reflect",
             should_revise,
@@ -233,112 +470,247 @@ class ReActReasoning:
         
         return workflow.compile()
     
-    def _update_reflection_steps_in_db(self, state: ReflectionState, new_step: Dict[str, Any]):
-        """Update the conversation in database with current reflection steps."""
-        if not state["supabase_client"] or not state["conversation_id"]:
-            return
+    async def _run_fast_path(self, state: ReflectionState) -> Optional[ReflectionState]:
+        """
+        Run generate, reflect and revise as one JSON-mode LLM call.
         
-        # Add new step to current steps
-        state["current_steps"].append(new_step)
+        Emits the same current_steps entries as the workflow so the UI is
+        unchanged. Returns None if the reply can't be parsed, so the caller
+        can fall back to the full workflow.
+        """
+        print("⚡ Reflection: FAST PATH")
+        
+        messages = _react_template("fast_path_prompt").format_messages(
+            system_prompt=state["system_prompt"],
+            context=self._format_history(state["conversation_history"]),
+            user_input=state["user_input"]
+        )
         
         try:
-            # Update the conversation record with current reflection steps
-            state["supabase_client"].table("conversations").update({
-                "reflection_steps": state["current_steps"]
-            }).eq("id", state["conversation_id"]).execute()
+            response = await self.llm.bind(response_format={"type": "json_object"}).ainvoke(messages)
+            data = json.loads(response.content)
+            draft = str(data["draft"])
+            critique = str(data["critique"])
+            final = str(data.get("final") or draft)
+            needs_revision = bool(data.get("needs_revision", False))
+        except Exception as e:
+            print(f"Fast path failed, using full workflow: {e}")
+            return None
+        
+        state["draft_response"] = draft
+        state["reflection"] = critique
+        state["needs_revision"] = needs_revision
+        state["final_response"] = final if needs_revision else draft
+        state["iteration_count"] = 2 if needs_revision else 1
+        
+        steps = [
+            ("generation_start", "Starting to generate response..."),
+            ("generation", f"Initial response generated ({len(draft)} chars)"),
+            ("reflection_start", "Analyzing response quality..."),
+            ("reflection", critique[:200] + "..." if len(critique) > 200 else critique),
+        ]
+        if needs_revision:
+            steps.append(("revision_start", "Improving response based on reflection..."))
+            steps.append(("revision", f"Response revised ({len(final)} chars)"))
+        else:
+            steps.append(("finalization", "Response approved without revision"))
+        
+        for step_type, step_content in steps:
+            self._update_reflection_steps_in_db(state, Step(
+                step=STEP_NUMBERS[step_type],
+                type=step_type,
+                content=step_content
+            ))
+        
+        return state
+    
+    async def _run_best_of_n(self, state: ReflectionState) -> Optional[ReflectionState]:
+        """
+        Draft candidates in parallel at different temperatures and let one
+        short LLM call pick the best.
+        
+        Returns None if drafting or picking fails, so the caller can fall
+        back to the reflection workflow. Steps are only recorded once the
+        pick succeeds, so a fallback never duplicates step numbers.
+        """
+        print("🎯 Reflection: BEST OF N")
+        
+        generate_prompt = self._create_generate_prompt(state)
+        try:
+            drafts = await asyncio.gather(*[
+                _get_llm(self.model, temperature).ainvoke([generate_prompt])
+                for temperature in BEST_OF_N_TEMPERATURES
+            ])
+            candidates = [draft.content for draft in drafts]
             
-            print(f"🔍 Updated DB with step {new_step['step']}: {new_step['type']}")
+            pick_messages = _react_template("pick_best_prompt").format_messages(
+                system_prompt=state["system_prompt"],
+                context=self._format_history(state["conversation_history"]),
+                user_input=state["user_input"],
+                candidates="\n\n".join(
+                    f"RESPOSTA {number}:\n{candidate}"
+                    for number, candidate in enumerate(candidates, 1)
+                )
+            )
+            pick = (await self.llm.ainvoke(pick_messages)).content
         except Exception as e:
-            print(f"Error updating reflection steps in DB: {e}")
+            print(f"Best of N failed, using reflection workflow: {e}")
+            return None
+        
+        # Out-of-range or missing numbers keep the first (low temperature) draft
+        match = re.search(r"\d+", pick)
+        index = int(match.group()) - 1 if match else 0
+        if not 0 <= index < len(candidates):
+            index = 0
+        
+        state["draft_response"] = candidates[index]
+        state["reflection"] = pick
+        state["needs_revision"] = False
+        state["final_response"] = candidates[index]
+        state["iteration_count"] = 1
+        
+        steps = [
+            ("generation_start", f"Generating {len(candidates)} candidate responses..."),
+            ("generation", f"{len(candidates)} candidate responses generated"),
+            ("finalization", f"Candidate {index + 1} of {len(candidates)} selected"),
+        ]
+        for step_type, step_content in steps:
+            self._update_reflection_steps_in_db(state, Step(
+                step=STEP_NUMBERS[step_type],
+                type=step_type,
+                content=step_content
+            ))
+        
+        return state
+    
+    async def _stream_with_progress(
+        self,
+        state: ReflectionState,
+        messages: List,
+        step_type: str,
+        every_chars: int = 200
+    ) -> str:
+        """
+        Stream an LLM reply, emitting a progress step every `every_chars`
+        characters so the UI sees the answer taking shape.
+        
+        Returns:
+            The full reply text
+        """
+        parts = []
+        received = 0
+        next_update = every_chars
+        # One progress step, updated in place, so the recorded steps don't grow with the reply
+        progress: Optional[Step] = None
+        async for chunk in self.llm.astream(messages):
+            parts.append(chunk.content)
+            received += len(chunk.content)
+            if received >= next_update:
+                next_update = received + every_chars
+                if progress is None:
+                    progress = Step(step=STEP_NUMBERS[step_type], type=step_type, content="")
+                progress.content = f"{received} chars so far..."
+                progress.timestamp_ns = time.time_ns()
+                self._update_reflection_steps_in_db(state, progress)
+        
+        return "".join(parts)
     
-    def _create_generate_prompt(self, state: ReflectionState) -> SystemMessage:
+    def _parse_revision_decision(self, reflection: str) -> bool:
+        """Read the DECISION: YES/NO verdict from the end of the reflection."""
+        decisions = DECISION_RE.findall(reflection[-200:])
+        if decisions:
+            return decisions[-1] == "YES"
+        
+        # Fallback heuristic when the model omitted the verdict line
+        return bool(_REVISE_HINT.search(reflection))
+    
+    def _update_reflection_steps_in_db(self, state: ReflectionState, new_step: Step):
+        """
+        Record a reflection step and queue it for the debounced database write.
+        
+        Never blocks: the step writer batches queued steps in the background
+        and is flushed once at the end of process_with_reasoning. Passing the
+        latest step again (updated in place) re-queues it without adding an entry.
+        """
+        # Add new step to current steps
+        _append_step(state["current_steps"], new_step)
+        if state["step_writer"]:
+            state["step_writer"].put(new_step)
+    
+    # All prompts open with the same system_prompt + context prefix so the
+    # provider's automatic prompt caching can reuse it across the three calls
+    def _create_generate_prompt(self, state: ReflectionState) -> "SystemMessage":
         """Create prompt for initial response generation."""
         
         context = self._format_history(state["conversation_history"])
         
-        # Use the prompt management system
-        content = get_react_generate_prompt({
-            "system_prompt": state["system_prompt"],
-            "context": context,
-            "user_input": state["user_input"]
-        })
-        
-        return SystemMessage(content=content)
+        return _react_template("generate_prompt").format_messages(
+            system_prompt=state["system_prompt"],
+            context=context,
+            user_input=state["user_input"]
+        )[0]
     
-    def _create_reflection_prompt(self, state: ReflectionState) -> SystemMessage:
+    def _create_reflection_prompt(self, state: ReflectionState) -> "SystemMessage":
         """Create prompt for reflecting on the draft response."""
         
-        # Use the prompt management system
-        content = get_react_reflection_prompt({
-            "user_input": state["user_input"],
-            "draft_response": state["draft_response"]
-        })
-        
-        return SystemMessage(content=content)
+        return _react_template("reflection_prompt").format_messages(
+            system_prompt=state["system_prompt"],
+            context=self._format_history(state["conversation_history"]),
+            user_input=state["user_input"],
+            draft_response=state["draft_response"]
+        )[0]
     
-    def _create_revision_prompt(self, state: ReflectionState) -> SystemMessage:
+    def _create_revision_prompt(self, state: ReflectionState) -> "SystemMessage":
         """Create prompt for revising the response based on reflection."""
         
-        # Use the prompt management system
-        content = get_react_revision_prompt({
-            "system_prompt": state["system_prompt"],
-            "user_input": state["user_input"],
-            "draft_response": state["draft_response"],
-            "reflection": state["reflection"]
-        })
-        
-        return SystemMessage(content=content)
+        return _react_template("revision_prompt").format_messages(
+            system_prompt=state["system_prompt"],
+            context=self._format_history(state["conversation_history"]),
+            user_input=state["user_input"],
+            draft_response=state["draft_response"],
+            reflection=state["reflection"]
+        )[0]
     
     def _format_history(self, conversation_history: List) -> str:
         """Format conversation history for context."""
         if not conversation_history:
             return "Nenhuma conversa anterior."
         
+        key = []
+        for msg in conversation_history[-2:]:  # Last 2 messages (already bounded by process_with_reasoning)
+            # LangChain messages or plain {"type": ..., "content": ...} dicts
+            if isinstance(msg, dict):
+                msg_type, text = msg.get("type"), msg.get("content")
+            else:
+                msg_type, text = getattr(msg, "type", None), getattr(msg, "content", None)
+            if text is not None:
+                # 81 chars is enough to tell whether the message gets truncated
+                key.append((msg_type, text[:81]))
+        
+        return self._format_history_cached(tuple(key))
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _format_history_cached(key: tuple) -> str:
+        """Format (type, content prefix) pairs; memoized across calls and prompts."""
         formatted = []
-        for msg in conversation_history[-2:]:  # Last 2 messages
-            if hasattr(msg, 'content'):
-                role = "Usuário" if isinstance(msg, HumanMessage) else "Edith"
-                formatted.append(f"{role}: {msg.content[:80]}...")
+        for msg_type, text in key:
+            role = "Usuário" if msg_type == "human" else "Edith"
+            content = text if len(text) <= 80 else f"{text[:80]}..."
+            formatted.append(f"{role}: {content}")
         
-        return " | ".join(formatted)
+        return " | ".join(ReActReasoning._dedup_prompt_chunks(formatted))
     
-    def _format_reflection_steps(self, final_state: ReflectionState) -> List[Dict[str, Any]]:
-        """Format reflection steps as JSONB array for database storage."""
-        steps = []
-        current_time = datetime.now().isoformat()
-        
-        if final_state["draft_response"]:
-            steps.append({
-                "step": 1,
-                "type": "generation",
-                "content": f"Initial response generated ({len(final_state['draft_response'])} chars)",
-                "timestamp": current_time
-            })
-        
-        if final_state["reflection"]:
-            steps.append({
-                "step": 2,
-                "type": "reflection", 
-                "content": final_state["reflection"],
-                "timestamp": current_time
-            })
-        
-        if final_state["needs_revision"]:
-            steps.append({
-                "step": 3,
-                "type": "revision",
-                "content": "Response revised based on reflection",
-                "timestamp": current_time
-            })
-        else:
-            steps.append({
-                "step": 3,
-                "type": "finalization",
-                "content": "Response approved without revision",
-                "timestamp": current_time
-            })
-        
-        return steps
+    @staticmethod
+    def _dedup_prompt_chunks(chunks: List[str]) -> List[str]:
+        """Drop byte-identical repeated chunks, keeping first-seen order."""
+        return list(dict.fromkeys(chunks))
+
+
+@lru_cache(maxsize=1)
+def _get_shared_reasoner() -> ReActReasoning:
+    """Module-wide reasoner, created on first use (needs OPENAI_API_KEY)."""
+    return ReActReasoning()
 
 
 # Utility function for easy import
@@ -348,5 +720,5 @@ async def process_complex_query(
     conversation_history: List = None
 ) -> Dict[str, Any]:
     """Convenience function to process a complex query with reflection reasoning."""
-    reasoner = ReActReasoning()
+    reasoner = _get_shared_reasoner()
     return await reasoner.process_with_reasoning(user_input, system_prompt, conversation_history)
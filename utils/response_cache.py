@@ -0,0 +1,129 @@
+"""
+Response caching for the reflection reasoning workflow.
+
+Two tiers sit in front of ReActReasoning.process_with_reasoning:
+1. Exact: a TTL cache keyed by a hash of (user_input, system_prompt, history)
+2. Semantic: cosine similarity of the user_input embedding against earlier
+   inputs asked with the same system prompt and conversation history, for
+   near-identical questions
+"""
+
+from typing import Dict, Any, List, Optional, Tuple
+from cachetools import TTLCache
+from collections import Counter
+import numpy as np
+import hashlib
+import os
+import time
+
+
+class ReasoningCache:
+    """Two-tier (exact + semantic) cache of reasoning results."""
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl: float = 3600,
+        similarity_threshold: float = 0.95,
+        max_semantic_entries: int = 1024,
+        embeddings: Any = None
+    ):
+        self.exact = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self.max_semantic_entries = max_semantic_entries
+        if embeddings is None:
+            from langchain_openai import OpenAIEmbeddings
+            embeddings = OpenAIEmbeddings(
+                model=os.getenv("EMBEDDING_MODEL", "text-embedding-3-small"),
+                openai_api_key=os.getenv("OPENAI_API_KEY")
+            )
+        self.embeddings = embeddings
+
+        # Semantic tier: one normalized embedding row per cached answer
+        self._matrix: Optional[np.ndarray] = None
+        self._results: List[Dict[str, Any]] = []
+        self._scopes: List[str] = []
+        self._created: List[float] = []
+        self._scope_counts: Counter = Counter()
+
+    @staticmethod
+    def make_key(user_input: str, system_prompt: str, formatted_history: str) -> str:
+        """Hash the prompt inputs into an exact-match cache key."""
+        raw = "\x1f".join((user_input, system_prompt, formatted_history))
+        return hashlib.blake2b(raw.encode()).hexdigest()
+
+    @staticmethod
+    def make_scope(system_prompt: str, formatted_history: str) -> str:
+        """Hash the context a semantic match must share (everything but the input)."""
+        raw = "\x1f".join((system_prompt, formatted_history))
+        return hashlib.blake2b(raw.encode()).hexdigest()
+
+    def get_exact(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for an exact key, if still fresh."""
+        return self.exact.get(key)
+
+    def put(self, key: str, result: Dict[str, Any]):
+        """Store a result in the exact tier."""
+        self.exact[key] = result
+
+    async def get_semantic(self, user_input: str, scope: str) -> Tuple[Optional[Dict[str, Any]], Optional[np.ndarray]]:
+        """
+        Look up a near-identical earlier input asked in the same scope.
+
+        Skips the embedding call entirely when the scope has no cached rows.
+
+        Returns:
+            (cached result or None, the input's normalized embedding or None)
+        """
+        if not self._scope_counts[scope]:
+            return None, None
+
+        query = self._normalize(await self.embeddings.aembed_query(user_input))
+
+        # One vectorized dot product against every cached embedding
+        similarities = self._matrix @ query
+        now = time.monotonic()
+        for index in np.argsort(similarities)[::-1]:
+            if similarities[index] < self.similarity_threshold:
+                break
+            # Entries from other scopes or past their TTL never match
+            if self._scopes[index] == scope and now - self._created[index] < self.ttl:
+                return self._results[index], query
+
+        return None, query
+
+    async def put_semantic(self, scope: str, user_input: str, result: Dict[str, Any], embedding: Optional[np.ndarray] = None):
+        """
+        Store a result in the semantic tier, embedding the input if needed.
+
+        Meant to run off the request's critical path; failures are logged.
+        """
+        try:
+            if embedding is None:
+                embedding = self._normalize(await self.embeddings.aembed_query(user_input))
+        except Exception as e:
+            print(f"Semantic cache store failed: {e}")
+            return
+
+        row = embedding.reshape(1, -1)
+        self._matrix = row if self._matrix is None else np.vstack([self._matrix, row])
+        self._results.append(result)
+        self._scopes.append(scope)
+        self._created.append(time.monotonic())
+        self._scope_counts[scope] += 1
+
+        # Evict the oldest entries beyond the semantic tier bound
+        overflow = len(self._results) - self.max_semantic_entries
+        if overflow > 0:
+            self._matrix = self._matrix[overflow:]
+            self._scope_counts.subtract(self._scopes[:overflow])
+            del self._results[:overflow]
+            del self._scopes[:overflow]
+            del self._created[:overflow]
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
@@ -8,7 +8,6 @@ and properly formatted results with citations.
 import asyncio
 import os
 from dotenv import load_dotenv
-from reactTavily import create_researcher, ResearchRequest
 
 # Load environment variables
 load_dotenv()
@@ -27,6 +26,7 @@ async def main():
         print("Please set up your .env file with the required API keys.")
         return
     
+    researcher = None
     try:
         # Create researcher
         researcher = create_researcher()
@@ -84,9 +84,14 @@ async def main():
         
     except Exception as e:
         print(f"❌ Research failed: {str(e)}")
+    finally:
+        # asyncio.run closes the loop on return; release the HTTP session first
+        if researcher is not None:
+            await researcher.aclose()
 
 if __name__ == "__main__":
-    # Check if we can import the module
+    # Import here so a missing dependency reaches the friendly error below;
+    # main() picks these names up from the module globals
     try:
         from reactTavily import create_researcher, ResearchRequest
         print("✅ React Tavily module loaded successfully\n")
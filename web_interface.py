@@ -5,14 +5,17 @@ Real-time research visualization with modern UI
 """
 
 import asyncio
+import html
 import json
 import os
+import queue
 import threading
-import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import streamlit as st
+import streamlit.components.v1 as components
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -25,6 +28,36 @@ except ImportError:
     st.error("❌ Could not import React Tavily. Make sure you're running from the project root.")
     st.stop()
 
+# Logs kept per session, and how many of the latest are rendered
+MAX_RESEARCH_LOGS = 64
+RENDERED_RESEARCH_LOGS = 10
+
+# Result card markup; every field is html.escape'd before formatting
+_FINDING_TPL = '<div class="research-card"><strong>{number}.</strong> {finding}</div>'
+_SRC_TPL = (
+    '<div class="source-card"><strong>[{id}]</strong> {title}<br>'
+    '<a href="{url}" target="_blank">🔗 {url}</a></div>'
+)
+
+# Client-side clock card. st.markdown drops <script> tags, so this renders
+# through components.html (its own iframe, hence the inline metric-card look)
+_CLOCK_CARD_HEIGHT = 130
+_CLOCK_CARD_HTML = """
+<div style="background: white; padding: 1rem; border-radius: 8px;
+            box-shadow: 0 2px 5px rgba(0,0,0,0.1); text-align: center;
+            font-family: 'Source Sans Pro', sans-serif;">
+    <h3 style="margin: 0.25rem 0;">🕐 Time</h3>
+    <h2 style="margin: 0.25rem 0;"><span id="_clk">--:--:--</span></h2>
+</div>
+<script>
+    const tick = () => {
+        document.getElementById('_clk').textContent = new Date().toTimeString().slice(0, 8);
+    };
+    tick();
+    setInterval(tick, 1000);
+</script>
+"""
+
 # Page configuration
 st.set_page_config(
     page_title="React Tavily Research",
@@ -33,81 +66,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for modern UI
-st.markdown("""
-<style>
-    .main-header {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 10px;
-        color: white;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    
-    .research-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        margin-bottom: 1rem;
-        border-left: 4px solid #667eea;
-    }
-    
-    .status-running {
-        background: linear-gradient(90deg, #56ab2f 0%, #a8e6cf 100%);
-        color: white;
-        padding: 0.5rem 1rem;
-        border-radius: 20px;
-        font-weight: bold;
-    }
-    
-    .status-completed {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 0.5rem 1rem;
-        border-radius: 20px;
-        font-weight: bold;
-    }
-    
-    .status-error {
-        background: linear-gradient(90deg, #ff416c 0%, #ff4b2b 100%);
-        color: white;
-        padding: 0.5rem 1rem;
-        border-radius: 20px;
-        font-weight: bold;
-    }
-    
-    .source-card {
-        background: #f8f9fa;
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 0.5rem 0;
-        border-left: 3px solid #28a745;
-    }
-    
-    .metric-card {
-        background: white;
-        padding: 1rem;
-        border-radius: 8px;
-        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        text-align: center;
-    }
-    
-    .progress-bar {
-        background: #e9ecef;
-        border-radius: 10px;
-        height: 10px;
-        overflow: hidden;
-    }
-    
-    .progress-fill {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        height: 100%;
-        transition: width 0.3s ease;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS for modern UI, served from static/style.css (needs
+# server.enableStaticServing) so the browser caches it across reruns
+st.markdown('<link rel="stylesheet" href="app/static/style.css">', unsafe_allow_html=True)
 
 def init_session_state():
     """Initialize session state variables."""
@@ -115,8 +76,10 @@ def init_session_state():
         st.session_state.research_results = None
     if 'research_status' not in st.session_state:
         st.session_state.research_status = "idle"
-    if 'research_logs' not in st.session_state:
-        st.session_state.research_logs = []
+    # Both log deques are created together; a session that has only one of
+    # them (e.g. after a hot reload) starts with fresh logs
+    if 'research_logs' not in st.session_state or 'render_logs' not in st.session_state:
+        reset_research_logs()
     if 'current_step' not in st.session_state:
         st.session_state.current_step = ""
     if 'progress' not in st.session_state:
@@ -124,6 +87,21 @@ def init_session_state():
     if 'sources_found' not in st.session_state:
         st.session_state.sources_found = 0
 
+def reset_research_logs():
+    """Start empty logs: the bounded history plus the tail that gets rendered."""
+    st.session_state.research_logs = deque(maxlen=MAX_RESEARCH_LOGS)
+    st.session_state.render_logs = deque(maxlen=RENDERED_RESEARCH_LOGS)
+
+def add_research_log(message: str, log_type: str = 'info'):
+    """Append a timestamped workflow log entry to both log deques."""
+    log = {
+        'timestamp': datetime.now().strftime("%H:%M:%S"),
+        'message': message,
+        'type': log_type
+    }
+    st.session_state.research_logs.append(log)
+    st.session_state.render_logs.append(log)
+
 def check_environment():
     """Check if required environment variables are set."""
     required_vars = ["OPENAI_API_KEY", "TAVILY_API_KEY"]
@@ -139,6 +117,10 @@ def render_header():
     </div>
     """, unsafe_allow_html=True)
 
+def use_example(example: str):
+    """Button callback: put the chosen example into the query text area."""
+    st.session_state.query = example
+
 def render_sidebar():
     """Render the sidebar with research configuration."""
     st.sidebar.header("🔧 Research Configuration")
@@ -155,6 +137,7 @@ def render_sidebar():
     # Research query input
     query = st.sidebar.text_area(
         "🔍 Research Query",
+        key='query',
         placeholder="Enter your research question here...",
         height=100,
         help="Enter a comprehensive research question you'd like to investigate"
@@ -184,9 +167,9 @@ def render_sidebar():
     ]
     
     selected_example = st.sidebar.selectbox("Choose an example:", [""] + examples)
-    if selected_example and st.sidebar.button("Use Example"):
-        query = selected_example
-        st.rerun()
+    if selected_example:
+        # The callback fills the query box before the click's own rerun renders it
+        st.sidebar.button("Use Example", on_click=use_example, args=(selected_example,))
     
     # Research button
     research_config = None
@@ -204,40 +187,31 @@ def render_sidebar():
 
 def render_progress_section():
     """Render the research progress section."""
-    col1, col2, col3, col4 = st.columns(4)
+    metrics_col, clock_col = st.columns([3, 1])
     
-    with col1:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>📊 Progress</h3>
-            <h2>{:.0f}%</h2>
-        </div>
-        """.format(st.session_state.progress), unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>📚 Sources</h3>
-            <h2>{}</h2>
+    with metrics_col:
+        # Progress, sources and status cards as one flex row in a single element
+        status = st.session_state.research_status
+        st.markdown(f"""
+        <div class="metric-row">
+            <div class="metric-card">
+                <h3>📊 Progress</h3>
+                <h2>{st.session_state.progress:.0f}%</h2>
+            </div>
+            <div class="metric-card">
+                <h3>📚 Sources</h3>
+                <h2>{st.session_state.sources_found}</h2>
+            </div>
+            <div class="metric-card">
+                <h3>⚡ Status</h3>
+                <span class="status-{status}">{status.title()}</span>
+            </div>
         </div>
-        """.format(st.session_state.sources_found), unsafe_allow_html=True)
+        """, unsafe_allow_html=True)
     
-    with col3:
-        status_class = f"status-{st.session_state.research_status}"
-        st.markdown("""
-        <div class="metric-card">
-            <h3>⚡ Status</h3>
-            <span class="{}">{}</span>
-        </div>
-        """.format(status_class, st.session_state.research_status.title()), unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>🕐 Time</h3>
-            <h2>{}</h2>
-        </div>
-        """.format(datetime.now().strftime("%H:%M:%S")), unsafe_allow_html=True)
+    with clock_col:
+        # Ticks in the browser, so keeping the clock live needs no rerun
+        components.html(_CLOCK_CARD_HTML, height=_CLOCK_CARD_HEIGHT)
     
     # Progress bar
     if st.session_state.progress > 0:
@@ -258,7 +232,7 @@ def render_research_logs():
         
         logs_container = st.container()
         with logs_container:
-            for i, log in enumerate(st.session_state.research_logs[-10:]):  # Show last 10 logs
+            for log in st.session_state.render_logs:  # Last 10 logs
                 timestamp = log.get('timestamp', '')
                 message = log.get('message', '')
                 log_type = log.get('type', 'info')
@@ -272,38 +246,62 @@ def render_research_logs():
                 else:
                     st.info(f"ℹ️ {timestamp} - {message}")
 
+# Bounded so distinct results from every session can't accumulate for the process lifetime
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def _render_results_html(
+    summary: str,
+    findings: Tuple[str, ...],
+    analysis: str,
+    sources: Tuple[Tuple[str, str, str], ...]
+) -> Tuple[str, str, str, str]:
+    """
+    Build the summary, findings, analysis and sources HTML for a result.
+    
+    Cached on the result's contents, so reruns showing the same result
+    reuse the strings instead of rebuilding every card.
+    """
+    summary_html = f'<div class="research-card"><p>{html.escape(summary)}</p></div>'
+    # One markdown element for all findings instead of one per finding
+    findings_html = "".join(
+        _FINDING_TPL.format(number=i, finding=html.escape(finding))
+        for i, finding in enumerate(findings, 1)
+    )
+    analysis_html = f'<div class="research-card"><p>{html.escape(analysis)}</p></div>'
+    sources_html = "".join(
+        _SRC_TPL.format(
+            id=html.escape(source_id),
+            title=html.escape(title),
+            url=html.escape(url, quote=True)
+        )
+        for source_id, title, url in sources
+    )
+    return summary_html, findings_html, analysis_html, sources_html
+
 def render_results():
     """Render the research results."""
     if st.session_state.research_results:
         result = st.session_state.research_results
+        summary_html, findings_html, analysis_html, sources_html = _render_results_html(
+            result.summary,
+            tuple(result.key_findings),
+            result.detailed_analysis,
+            tuple((source.id, source.title, source.url) for source in result.sources)
+        )
         
         st.header("📊 Research Results")
         
         # Executive Summary
         st.subheader("📝 Executive Summary")
-        st.markdown(f"""
-        <div class="research-card">
-            <p>{result.summary}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(summary_html, unsafe_allow_html=True)
         
         # Key Findings
         if result.key_findings:
             st.subheader("🔑 Key Findings")
-            for i, finding in enumerate(result.key_findings, 1):
-                st.markdown(f"""
-                <div class="research-card">
-                    <strong>{i}.</strong> {finding}
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown(findings_html, unsafe_allow_html=True)
         
         # Detailed Analysis
         st.subheader("📈 Detailed Analysis")
-        st.markdown(f"""
-        <div class="research-card">
-            <p>{result.detailed_analysis}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(analysis_html, unsafe_allow_html=True)
         
         # Sources
         if result.sources:
@@ -311,13 +309,7 @@ def render_results():
             
             # Create expandable sections for sources
             with st.expander(f"📖 View All {len(result.sources)} Sources", expanded=False):
-                for source in result.sources:
-                    st.markdown(f"""
-                    <div class="source-card">
-                        <strong>[{source.id}]</strong> {source.title}<br>
-                        <a href="{source.url}" target="_blank">🔗 {source.url}</a>
-                    </div>
-                    """, unsafe_allow_html=True)
+                st.markdown(sources_html, unsafe_allow_html=True)
         
         # Research Statistics
         st.subheader("📊 Research Statistics")
@@ -331,30 +323,22 @@ def render_results():
         with col3:
             st.metric("Citations", len(result.citations_map))
 
-def simulate_research_progress():
-    """Simulate research progress for UI feedback."""
-    progress_steps = [
-        ("🧠 Breaking down query into research questions...", 15),
-        ("🔍 Performing parallel web searches...", 40),
-        ("📊 Analyzing search results...", 65),
-        ("🔄 Consolidating findings...", 85),
-        ("📋 Generating final report...", 95),
-        ("✅ Research completed!", 100)
-    ]
+@st.cache_resource
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Long-lived event loop on a daemon thread, shared by every rerun.
     
-    for step_msg, step_progress in progress_steps:
-        st.session_state.current_step = step_msg
-        st.session_state.progress = step_progress
-        
-        # Add to logs
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        st.session_state.research_logs.append({
-            'timestamp': timestamp,
-            'message': step_msg,
-            'type': 'info'
-        })
-        
-        yield step_msg, step_progress
+    Keeping one loop alive lets the researcher's aiohttp session and its
+    pooled connections survive between queries.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True, name="research-loop").start()
+    return loop
+
+@st.cache_resource
+def get_researcher(verbose: bool):
+    """One researcher per verbose setting, shared across reruns and sessions."""
+    return create_researcher(verbose=verbose)
 
 def run_research_sync(config: Dict):
     """Run the research synchronously."""
@@ -363,8 +347,8 @@ def run_research_sync(config: Dict):
         st.session_state.progress = 0
         st.session_state.sources_found = 0
         
-        # Create researcher
-        researcher = create_researcher(verbose=config.get('verbose', True))
+        # Reuse the researcher (and its HTTP session) across queries
+        researcher = get_researcher(config.get('verbose', True))
         
         # Create research request
         request = ResearchRequest(
@@ -379,26 +363,36 @@ def run_research_sync(config: Dict):
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        # Update progress
-        for step_msg, step_progress in simulate_research_progress():
-            progress_bar.progress(step_progress / 100)
-            status_text.text(step_msg)
-            time.sleep(0.5)  # Visual delay
+        # Run the research on the persistent background loop, showing each
+        # real milestone as the researcher reports it
+        progress_queue = queue.Queue()
+        future = asyncio.run_coroutine_threadsafe(
+            researcher.research(request, progress_queue=progress_queue),
+            get_background_loop()
+        )
+        while True:
+            try:
+                event = progress_queue.get(timeout=0.1)
+            except queue.Empty:
+                if future.done():
+                    break
+                continue
+            
+            st.session_state.current_step = event['stage']
+            st.session_state.progress = event['pct']
+            add_research_log(event['stage'])
+            progress_bar.progress(event['pct'] / 100)
+            status_text.text(event['stage'])
         
-        # Run the actual research (this is sync in our current implementation)
-        import asyncio
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(researcher.research(request))
-        finally:
-            loop.close()
+        result = future.result()
         
         # Update final state
         st.session_state.sources_found = len(result.sources)
         st.session_state.research_status = "completed"
         st.session_state.research_results = result
         st.session_state.progress = 100
+        st.session_state.current_step = "✅ Research completed!"
+        add_research_log("✅ Research completed!", 'success')
         
         # Clear progress indicators
         progress_bar.empty()
@@ -432,7 +426,7 @@ def main():
         # Reset state for new research
         st.session_state.research_results = None
         st.session_state.research_status = "idle"
-        st.session_state.research_logs = []
+        reset_research_logs()
         st.session_state.current_step = ""
         st.session_state.progress = 0
         st.session_state.sources_found = 0